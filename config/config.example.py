@@ -28,6 +28,30 @@ TECH STACK:
 # SETUP: Replace with your desired channel URL
 CHANNEL_URL = "https://www.youtube.com/@YourChannelHere"
 
+# Channel tabs to scrape: "videos", "shorts", "streams" (live stream archives)
+# Several tabs are scraped in parallel; each video records the tab it came from
+SCRAPE_TABS = ["videos"]
+
+# Incremental scraping
+# After the first full scrape of a channel, later runs walk the channel
+# newest-first and stop once SCRAPE_STOP_AFTER_KNOWN videos in a row are
+# already in the database, so a daily sync takes seconds instead of minutes.
+# Run "python scripts/run_transcriber.py --full-resync" to force a full scrape.
+INCREMENTAL_SCRAPE = True
+SCRAPE_STOP_AFTER_KNOWN = 50
+
+# Do a full scrape anyway when the last one is older than this many days
+# (catches old videos that were unlisted or premiered late). 0 = never
+FULL_RESYNC_DAYS = 30
+
+# Scrape cache
+# Channel listings are cached (gzipped) in SCRAPE_CACHE_DIR and shared by
+# run_transcriber.py, prepare_for_modal.py and utils/find_missing.py.
+# A listing younger than SCRAPE_CACHE_TTL_HOURS is reused without contacting
+# YouTube; an older one is refreshed by fetching only the new uploads.
+SCRAPE_CACHE_DIR = "data/scrape_cache"
+SCRAPE_CACHE_TTL_HOURS = 6  # 0 = always scrape live
+
 
 # ============================================================================
 # WHISPER MODEL SETTINGS
@@ -53,15 +77,89 @@ MODEL_SIZE = "base"
 # More = faster downloads but may hit rate limits
 DOWNLOAD_WORKERS = 10
 
-# Number of parallel GPU transcriptions
-# IMPORTANT: MUST be set to 1 (Whisper models are not thread-safe)
-# Parallel transcription requires distributed architecture (not yet implemented)
+# Adaptive download concurrency
+# When set above DOWNLOAD_WORKERS, downloads start at DOWNLOAD_WORKERS and
+# the number running at once is adjusted from measured throughput: one more
+# after each round that got faster, halved on rate limiting (HTTP 429, bot
+# checks) or crawling transfers. Changes are logged, and the limit in force
+# is stored with each download in the timing metrics.
+MAX_DOWNLOAD_WORKERS = 0  # 0 = fixed at DOWNLOAD_WORKERS
+
+# Number of parallel transcription worker processes
+# 1 = transcribe in the main process (default)
+# >1 = each worker process loads its own Whisper model:
+#   - with GPUs, workers are spread round-robin across all visible GPUs
+#   - on CPU, the cores are split evenly between workers
+# 0 = automatic: one worker per model slot on every visible GPU
+#     (see MODELS_PER_GPU), or one worker per 4 CPU cores without a GPU
+# Each GPU worker needs its own copy of the model in VRAM
 TRANSCRIBE_WORKERS = 1
 
+# Whisper models loaded on each GPU when TRANSCRIBE_WORKERS is 0 or > 1
+# 0 = fit as many as VRAM allows (e.g. ~7 base models on an 8GB card)
+MODELS_PER_GPU = 1
+
+# Decode downloaded audio to 16 kHz mono PCM in this many CPU processes
+# ahead of transcription, so the GPU never waits on ffmpeg and broken files
+# fail before reaching the model (error class "decode"). 0 = decode inside
+# the transcriber
+DECODE_WORKERS = 2
+
+# Sample format of the decoded audio: "int16" (half the memory) or "float32"
+DECODE_DTYPE = "int16"
+
+# Hand decoded audio over as memory-mapped .npy files next to the audio
+# instead of in memory (always on with several TRANSCRIBE_WORKERS).
+# int16 PCM takes ~115 MB per hour of audio on disk until transcribed.
+DECODE_TO_DISK = False
+
+# PCM cache for re-transcription
+# Keeps the decoded audio of every video (int16 16 kHz .npy, ~115 MB per
+# hour) in PCM_CACHE_DIR, evicting the least recently used beyond
+# PCM_CACHE_GB. Re-running a channel (e.g. after reset_channel.py, with a
+# bigger MODEL_SIZE) then skips download and decode for cached videos.
+PCM_CACHE_DIR = "data/pcm_cache"
+PCM_CACHE_GB = 0  # 0 = off
+
 # Batch size - how many videos to download before transcribing
 # Lower = less disk space used, Higher = more efficient
+# In streaming mode this is the maximum number of downloaded files
+# waiting for transcription at any time
 BATCH_SIZE = 20
 
+# Order in which pending videos are processed
+# Options:
+#   - "longest_first"  - start long videos early so a multi-hour episode isn't
+#                        left running alone at the end (best with several workers)
+#   - "shortest_first" - quick wins first (the original behaviour)
+#   - "interleaved"    - alternate longest and shortest
+#   - "priority"       - by the videos.priority column, then longest first
+# Compare them for your channel with: python scripts/utils/simulate_schedule.py
+SCHEDULING_POLICY = "longest_first"
+
+# Expected transcription speed (x realtime), used for time estimates
+REALTIME_FACTOR = 35
+
+# Pipeline mode
+# Options:
+#   - "streaming" - downloads and transcription overlap; the GPU picks up
+#                   each file as soon as it finishes downloading
+#   - "batch"     - download BATCH_SIZE videos, then transcribe them, repeat
+PIPELINE_MODE = "streaming"
+
+# Start downloading as soon as the first page of the channel is scraped
+# (streaming mode only). New videos are processed newest-first while the
+# scrape continues; SCHEDULING_POLICY applies to everything after that.
+STREAMING_SCRAPE = True
+
+# Disk budget for downloaded audio waiting to be transcribed (streaming mode)
+# New downloads pause until transcription deletes files and frees space.
+# Useful when raising DOWNLOAD_WORKERS on machines with small disks.
+AUDIO_DISK_BUDGET_GB = 0  # 0 = no limit
+
+# Pause downloads when free disk space drops below this (0 = no floor)
+MIN_FREE_DISK_GB = 1
+
 
 # ============================================================================
 # OUTPUT SETTINGS
@@ -113,13 +211,68 @@ TASK = "transcribe"
 DELETE_AUDIO_AFTER_TRANSCRIPTION = True
 
 # Skip videos longer than X minutes (0 = no limit)
+# Skipped videos get the status "skipped" and are never downloaded; videos
+# whose duration is unknown are always processed. Relaxing the limits puts
+# previously skipped videos back in the queue on the next run.
 MAX_VIDEO_DURATION_MINUTES = 0
 
 # Skip videos shorter than X minutes (0 = no limit)
 MIN_VIDEO_DURATION_MINUTES = 0
 
+# Look up durations the channel listing didn't include (common for streams
+# and older uploads) before scheduling, using this many parallel metadata
+# requests. Nothing is downloaded. 0 = off
+METADATA_BACKFILL_WORKERS = 8
+
+# Retry duration lookups that failed (private, removed...) after this many days
+METADATA_RETRY_DAYS = 7
+
+# Audio stream to download
+# Options:
+#   - "speech"   - smallest audio stream that is fine for speech (~50 kbps
+#                  opus); Whisper resamples everything to 16 kHz mono, so
+#                  this transcribes the same at about a third of the size
+#                  (every preset prefers the original-language audio track
+#                  over dubbed and audio-description tracks)
+#   - "balanced" - up to ~96 kbps opus / 128 kbps AAC
+#   - "best"     - highest-bitrate audio stream (the old behaviour)
+#   - or any yt-dlp format selector, e.g. "bestaudio[ext=m4a]"
+# The bytes saved per video are stored in the progress database.
+AUDIO_FORMAT = "speech"
+
+# Download a low-resolution (480p or less) video format when a video has no
+# audio-only stream (otherwise it fails with error class "format_unavailable")
+ALLOW_VIDEO_FALLBACK = False
+
 # Retry failed downloads this many times
+# Only network errors and rate limiting are retried, with exponential backoff
+# (seconds for network errors, minutes when throttled). Private, removed,
+# geo-blocked and age-restricted videos fail at once.
 DOWNLOAD_RETRY_ATTEMPTS = 3
 
+# Retry downloads that still failed in later runs
+# After a video's n-th failed run it is put back in the queue by the first
+# run started at least DOWNLOAD_RETRY_SCHEDULE_HOURS[n-1] hours later; once
+# the list runs out it stays "error" (reset it with utils/reset_channel.py).
+# Permanent failures (private, removed, geo-blocked...) are never retried.
+# Premieres and live streams that haven't started yet are retried every
+# 12 hours for two weeks, whatever this list says.
+DOWNLOAD_RETRY_SCHEDULE_HOURS = [1, 6, 24, 72]  # [] = never
+
 # Device for Whisper (usually "cuda" for GPU, "cpu" for CPU)
 DEVICE = "cuda"
+
+# Progress database durability
+# The database uses WAL journaling, so status scripts can read it while
+# a run is writing.
+#
+# DB_SYNCHRONOUS:
+#   - "FULL"   - every commit is synced to disk (safest, slowest)
+#   - "NORMAL" - survives crashes of this program; a power loss may undo
+#                the last few commits (videos are then simply redone)
+DB_SYNCHRONOUS = "NORMAL"
+
+# Batch status updates into one commit every N milliseconds
+# Cuts disk syncs when many download workers update at once.
+# 0 = commit every update immediately
+DB_COMMIT_INTERVAL_MS = 50
@@ -50,6 +50,7 @@ if sys.stderr:
 # Import downloader components
 from channel_transcriber import ChannelTranscriptionOrchestrator
 import sqlite3
+import itertools
 
 def main():
     """Download pending videos only - no transcription"""
@@ -76,33 +77,23 @@ def main():
         print("Please run the main transcriber first to create the database.")
         sys.exit(1)
 
-    # Get pending videos
+    # Count pending videos and find their channel (the videos themselves are
+    # streamed from the database in batches below)
     conn = sqlite3.connect(DATABASE_FILE)
     cursor = conn.cursor()
 
-    cursor.execute('''
-        SELECT video_id, title, url, channel
-        FROM videos
-        WHERE status = 'pending'
-        ORDER BY video_id
-    ''')
-
-    pending_videos = []
-    channel_name = None
-    for row in cursor.fetchall():
-        pending_videos.append({
-            'video_id': row[0],
-            'title': row[1],
-            'url': row[2],
-        })
-        if channel_name is None and row[3]:
-            channel_name = row[3]
+    cursor.execute("SELECT COUNT(*) FROM videos WHERE status = 'pending'")
+    pending_count = cursor.fetchone()[0]
+
+    cursor.execute("SELECT channel FROM videos WHERE status = 'pending' AND channel IS NOT NULL LIMIT 1")
+    result = cursor.fetchone()
+    channel_name = result[0] if result else None
 
     conn.close()
 
-    print(f"Found {len(pending_videos)} pending videos to download")
+    print(f"Found {pending_count} pending videos to download")
 
-    if len(pending_videos) == 0:
+    if pending_count == 0:
         print("No pending videos to download!")
         return
 
@@ -117,7 +108,7 @@ def main():
 
     print(f"Channel: {channel_name}")
     print()
-    print(f"Starting download of {len(pending_videos)} videos...")
+    print(f"Starting download of {pending_count} videos...")
     print("Progress will be saved. Press Ctrl+C to stop anytime.")
     print()
 
@@ -137,18 +128,22 @@ def main():
     orchestrator.downloader = AudioDownloader(
         output_dir=AUDIO_DIR,
         channel_name=channel_name,
-        max_workers=DOWNLOAD_WORKERS
+        max_workers=DOWNLOAD_WORKERS,
+        retry_attempts=DOWNLOAD_RETRY_ATTEMPTS
     )
 
     # Process in batches
-    total_batches = (len(pending_videos) + BATCH_SIZE - 1) // BATCH_SIZE
+    pending_videos = orchestrator.tracker.iter_pending_videos(statuses=('pending',))
+    total_batches = (pending_count + BATCH_SIZE - 1) // BATCH_SIZE
+    batch_num = 0
 
-    for batch_num in range(total_batches):
-        start_idx = batch_num * BATCH_SIZE
-        end_idx = min(start_idx + BATCH_SIZE, len(pending_videos))
-        batch = pending_videos[start_idx:end_idx]
+    while True:
+        batch = list(itertools.islice(pending_videos, BATCH_SIZE))
+        if not batch:
+            break
+        batch_num += 1
 
-        print(f"\nBatch {batch_num + 1}/{total_batches}")
+        print(f"\nBatch {batch_num}/{total_batches}")
         print(f"Downloading {len(batch)} videos...")
 
         # Download batch
@@ -156,6 +151,8 @@ def main():
 
         print(f"Downloaded {len(downloaded)}/{len(batch)} videos successfully")
 
+    orchestrator.downloader.close()
+
     print()
     print("="*70)
     print("DOWNLOAD COMPLETE")
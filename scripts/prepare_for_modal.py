@@ -37,6 +37,18 @@ except ImportError:
     print("Please create config/config.py from the template")
     sys.exit(1)
 
+# Settings added after the original template
+import config as _config
+SCRAPE_TABS = getattr(_config, 'SCRAPE_TABS', ['videos'])
+SCRAPE_CACHE_DIR = getattr(_config, 'SCRAPE_CACHE_DIR', 'data/scrape_cache')
+SCRAPE_CACHE_TTL_HOURS = getattr(_config, 'SCRAPE_CACHE_TTL_HOURS', 0)
+MIN_VIDEO_DURATION_MINUTES = getattr(_config, 'MIN_VIDEO_DURATION_MINUTES', 0)
+MAX_VIDEO_DURATION_MINUTES = getattr(_config, 'MAX_VIDEO_DURATION_MINUTES', 0)
+MAX_DOWNLOAD_WORKERS = getattr(_config, 'MAX_DOWNLOAD_WORKERS', 0)
+DOWNLOAD_RETRY_SCHEDULE_HOURS = getattr(_config, 'DOWNLOAD_RETRY_SCHEDULE_HOURS', [])
+AUDIO_FORMAT = getattr(_config, 'AUDIO_FORMAT', 'speech')
+ALLOW_VIDEO_FALLBACK = getattr(_config, 'ALLOW_VIDEO_FALLBACK', False)
+
 # Setup logging
 import logging
 log_dir = Path(LOG_FILE).parent
@@ -67,10 +79,12 @@ if sys.stderr:
 # Import components
 from channel_transcriber import (
     ChannelScraper,
+    ScrapeCache,
     AudioDownloader,
     ProgressTracker
 )
 import sqlite3
+import itertools
 
 def main():
     """Prepare channel for Modal transcription - scrape, create DB, download all audio"""
@@ -102,8 +116,13 @@ def main():
             sys.exit(0)
 
     # Initialize components
-    tracker = ProgressTracker(db_path=DATABASE_FILE)
-    scraper = ChannelScraper(CHANNEL_URL)
+    tracker = ProgressTracker(
+        db_path=DATABASE_FILE,
+        min_duration=MIN_VIDEO_DURATION_MINUTES * 60,
+        max_duration=MAX_VIDEO_DURATION_MINUTES * 60
+    )
+    cache = ScrapeCache(SCRAPE_CACHE_DIR, ttl_seconds=SCRAPE_CACHE_TTL_HOURS * 3600) if SCRAPE_CACHE_TTL_HOURS else None
+    scraper = ChannelScraper(CHANNEL_URL, tabs=tuple(SCRAPE_TABS), cache=cache)
 
     # Step 1: Scrape channel
     print("\n[STEP 1/3] Scraping channel for videos...")
@@ -124,8 +143,14 @@ def main():
 
     # Step 2: Add videos to database
     print("[STEP 2/3] Creating/updating database...")
-    for video in videos:
-        tracker.add_video(video)
+    new_count = tracker.add_videos(videos)
+    print(f"New videos added: {new_count}")
+    retried = tracker.requeue_due_retries()
+    if retried:
+        print(f"Failed downloads due for retry: {retried}")
+    skipped, restored = tracker.apply_duration_filter()
+    if skipped or restored:
+        print(f"Duration filter: {skipped} videos newly skipped, {restored} restored")
 
     # Get statistics FOR THIS CHANNEL ONLY
     stats = tracker.get_stats(channel_filter=channel_name)
@@ -154,22 +179,35 @@ def main():
     downloader = AudioDownloader(
         output_dir=AUDIO_DIR,
         channel_name=channel_name,
-        max_workers=DOWNLOAD_WORKERS
+        max_workers=DOWNLOAD_WORKERS,
+        max_concurrency=MAX_DOWNLOAD_WORKERS,
+        retry_attempts=DOWNLOAD_RETRY_ATTEMPTS,
+        retry_schedule_seconds=[hours * 3600 for hours in DOWNLOAD_RETRY_SCHEDULE_HOURS],
+        audio_format=AUDIO_FORMAT,
+        allow_video_fallback=ALLOW_VIDEO_FALLBACK,
+        min_duration=MIN_VIDEO_DURATION_MINUTES * 60,
+        max_duration=MAX_VIDEO_DURATION_MINUTES * 60
     )
 
-    # Get pending videos FOR THIS CHANNEL ONLY
-    pending_videos = tracker.get_pending_videos(channel_filter=channel_name)
+    # Stream videos still needing a download FOR THIS CHANNEL ONLY
+    # (already-downloaded files are left alone)
+    download_statuses = ('downloading', 'pending')
+    status_counts = tracker.get_status_counts(channel_filter=channel_name)
+    to_download = sum(status_counts.get(status, {}).get('count', 0) for status in download_statuses)
+    pending_videos = tracker.iter_pending_videos(channel_filter=channel_name, statuses=download_statuses)
 
     # Download in batches
-    total_batches = (len(pending_videos) + BATCH_SIZE - 1) // BATCH_SIZE
+    total_batches = (to_download + BATCH_SIZE - 1) // BATCH_SIZE
     total_downloaded = 0
+    batch_num = 0
 
-    for batch_num in range(total_batches):
-        start_idx = batch_num * BATCH_SIZE
-        end_idx = min(start_idx + BATCH_SIZE, len(pending_videos))
-        batch = pending_videos[start_idx:end_idx]
+    while True:
+        batch = list(itertools.islice(pending_videos, BATCH_SIZE))
+        if not batch:
+            break
+        batch_num += 1
 
-        print(f"\nBatch {batch_num + 1}/{total_batches}")
+        print(f"\nBatch {batch_num}/{total_batches}")
         print(f"Downloading {len(batch)} videos...")
 
         # Download batch
@@ -177,7 +215,9 @@ def main():
         total_downloaded += len(downloaded)
 
         print(f"Downloaded {len(downloaded)}/{len(batch)} videos successfully")
-        print(f"Total progress: {total_downloaded}/{len(pending_videos)} videos")
+        print(f"Total progress: {total_downloaded}/{to_download} videos")
+
+    downloader.close()
 
     # Final summary
     print()
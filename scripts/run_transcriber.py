@@ -32,6 +32,41 @@ except ImportError:
     print("Please create config/config.py from the template")
     sys.exit(1)
 
+# Settings added after the original template - fall back to defaults so
+# older config.py files keep working
+import config as _config
+PIPELINE_MODE = getattr(_config, 'PIPELINE_MODE', 'streaming')
+AUDIO_DISK_BUDGET_GB = getattr(_config, 'AUDIO_DISK_BUDGET_GB', 0)
+MIN_FREE_DISK_GB = getattr(_config, 'MIN_FREE_DISK_GB', 0)
+MODELS_PER_GPU = getattr(_config, 'MODELS_PER_GPU', 1)
+SCHEDULING_POLICY = getattr(_config, 'SCHEDULING_POLICY', 'shortest_first')
+REALTIME_FACTOR = getattr(_config, 'REALTIME_FACTOR', 35)
+DB_SYNCHRONOUS = getattr(_config, 'DB_SYNCHRONOUS', 'FULL')
+DB_COMMIT_INTERVAL_MS = getattr(_config, 'DB_COMMIT_INTERVAL_MS', 0)
+INCREMENTAL_SCRAPE = getattr(_config, 'INCREMENTAL_SCRAPE', False)
+SCRAPE_STOP_AFTER_KNOWN = getattr(_config, 'SCRAPE_STOP_AFTER_KNOWN', 50)
+FULL_RESYNC_DAYS = getattr(_config, 'FULL_RESYNC_DAYS', 0)
+STREAMING_SCRAPE = getattr(_config, 'STREAMING_SCRAPE', False)
+SCRAPE_TABS = getattr(_config, 'SCRAPE_TABS', ['videos'])
+SCRAPE_CACHE_DIR = getattr(_config, 'SCRAPE_CACHE_DIR', 'data/scrape_cache')
+SCRAPE_CACHE_TTL_HOURS = getattr(_config, 'SCRAPE_CACHE_TTL_HOURS', 0)
+MIN_VIDEO_DURATION_MINUTES = getattr(_config, 'MIN_VIDEO_DURATION_MINUTES', 0)
+MAX_VIDEO_DURATION_MINUTES = getattr(_config, 'MAX_VIDEO_DURATION_MINUTES', 0)
+METADATA_BACKFILL_WORKERS = getattr(_config, 'METADATA_BACKFILL_WORKERS', 0)
+METADATA_RETRY_DAYS = getattr(_config, 'METADATA_RETRY_DAYS', 7)
+MAX_DOWNLOAD_WORKERS = getattr(_config, 'MAX_DOWNLOAD_WORKERS', 0)
+DOWNLOAD_RETRY_SCHEDULE_HOURS = getattr(_config, 'DOWNLOAD_RETRY_SCHEDULE_HOURS', [])
+AUDIO_FORMAT = getattr(_config, 'AUDIO_FORMAT', 'speech')
+ALLOW_VIDEO_FALLBACK = getattr(_config, 'ALLOW_VIDEO_FALLBACK', False)
+DECODE_WORKERS = getattr(_config, 'DECODE_WORKERS', 0)
+DECODE_DTYPE = getattr(_config, 'DECODE_DTYPE', 'int16')
+DECODE_TO_DISK = getattr(_config, 'DECODE_TO_DISK', False)
+PCM_CACHE_DIR = getattr(_config, 'PCM_CACHE_DIR', 'data/pcm_cache')
+PCM_CACHE_GB = getattr(_config, 'PCM_CACHE_GB', 0)
+
+# --full-resync: scrape the whole channel even when incremental scraping is on
+FULL_RESYNC = '--full-resync' in sys.argv[1:]
+
 # Setup logging with proper paths
 log_dir = Path(LOG_FILE).parent
 if log_dir and str(log_dir) != '.':
@@ -76,10 +111,27 @@ def main():
     print("Configuration:")
     print("-" * 70)
     print(f"  Channel URL:         {CHANNEL_URL}")
+    print(f"  Channel Tabs:        {', '.join(SCRAPE_TABS)}")
+    print(f"  Scrape Cache:        {f'{SCRAPE_CACHE_TTL_HOURS} h ({SCRAPE_CACHE_DIR})' if SCRAPE_CACHE_TTL_HOURS else 'off'}")
+    if FULL_RESYNC or not INCREMENTAL_SCRAPE:
+        print(f"  Scrape Mode:         full")
+    else:
+        print(f"  Scrape Mode:         incremental (stop after {SCRAPE_STOP_AFTER_KNOWN} known)")
     print(f"  Model Size:          {MODEL_SIZE}")
-    print(f"  Download Workers:    {DOWNLOAD_WORKERS}")
-    print(f"  Transcribe Workers:  {TRANSCRIBE_WORKERS}")
+    if MAX_DOWNLOAD_WORKERS > DOWNLOAD_WORKERS:
+        print(f"  Download Workers:    {DOWNLOAD_WORKERS} (adaptive up to {MAX_DOWNLOAD_WORKERS})")
+    else:
+        print(f"  Download Workers:    {DOWNLOAD_WORKERS}")
+    print(f"  Transcribe Workers:  {TRANSCRIBE_WORKERS or 'auto'} ({MODELS_PER_GPU or 'auto'} per GPU)")
+    print(f"  Decode Ahead:        {f'{DECODE_WORKERS} processes ({DECODE_DTYPE})' if DECODE_WORKERS else 'off'}")
+    print(f"  PCM Cache:           {f'{PCM_CACHE_GB} GB ({PCM_CACHE_DIR})' if PCM_CACHE_GB else 'off'}")
     print(f"  Batch Size:          {BATCH_SIZE}")
+    print(f"  Audio Format:        {AUDIO_FORMAT}{' (video fallback allowed)' if ALLOW_VIDEO_FALLBACK else ''}")
+    print(f"  Pipeline Mode:       {PIPELINE_MODE}{' (streaming scrape)' if STREAMING_SCRAPE and PIPELINE_MODE != 'batch' else ''}")
+    print(f"  Scheduling Policy:   {SCHEDULING_POLICY}")
+    if MIN_VIDEO_DURATION_MINUTES or MAX_VIDEO_DURATION_MINUTES:
+        print(f"  Duration Filter:     {MIN_VIDEO_DURATION_MINUTES or 0}-{MAX_VIDEO_DURATION_MINUTES or 'unlimited'} minutes")
+    print(f"  Audio Disk Budget:   {AUDIO_DISK_BUDGET_GB or 'unlimited'} GB (min free: {MIN_FREE_DISK_GB} GB)")
     print(f"  Language:            {LANGUAGE}")
     print(f"  Device:              {DEVICE}")
     print(f"  Audio Directory:     {AUDIO_DIR}")
@@ -103,10 +155,42 @@ def main():
         channel_url=CHANNEL_URL,
         model_size=MODEL_SIZE,
         download_workers=DOWNLOAD_WORKERS,
+        max_download_workers=MAX_DOWNLOAD_WORKERS,
+        download_retry_attempts=DOWNLOAD_RETRY_ATTEMPTS,
+        download_retry_schedule_hours=DOWNLOAD_RETRY_SCHEDULE_HOURS,
+        audio_format=AUDIO_FORMAT,
+        allow_video_fallback=ALLOW_VIDEO_FALLBACK,
+        decode_workers=DECODE_WORKERS,
+        decode_dtype=DECODE_DTYPE,
+        decode_to_disk=DECODE_TO_DISK,
+        pcm_cache_dir=PCM_CACHE_DIR,
+        pcm_cache_gb=PCM_CACHE_GB,
         transcribe_workers=TRANSCRIBE_WORKERS,
         audio_base_dir=AUDIO_DIR,
         transcript_base_dir=TRANSCRIPT_DIR,
-        db_path=DATABASE_FILE
+        db_path=DATABASE_FILE,
+        batch_size=BATCH_SIZE,
+        pipeline_mode=PIPELINE_MODE,
+        disk_budget_gb=AUDIO_DISK_BUDGET_GB,
+        min_free_disk_gb=MIN_FREE_DISK_GB,
+        device=DEVICE,
+        models_per_gpu=MODELS_PER_GPU,
+        scheduling_policy=SCHEDULING_POLICY,
+        realtime_factor=REALTIME_FACTOR,
+        db_synchronous=DB_SYNCHRONOUS,
+        db_commit_interval=DB_COMMIT_INTERVAL_MS / 1000,
+        incremental_scrape=INCREMENTAL_SCRAPE,
+        scrape_stop_after_known=SCRAPE_STOP_AFTER_KNOWN,
+        full_resync_days=FULL_RESYNC_DAYS,
+        full_resync=FULL_RESYNC,
+        streaming_scrape=STREAMING_SCRAPE,
+        scrape_tabs=tuple(SCRAPE_TABS),
+        scrape_cache_dir=SCRAPE_CACHE_DIR,
+        scrape_cache_ttl_hours=SCRAPE_CACHE_TTL_HOURS,
+        min_duration_minutes=MIN_VIDEO_DURATION_MINUTES,
+        max_duration_minutes=MAX_VIDEO_DURATION_MINUTES,
+        metadata_workers=METADATA_BACKFILL_WORKERS,
+        metadata_retry_days=METADATA_RETRY_DAYS
     )
 
     try:
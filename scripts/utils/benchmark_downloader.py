@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Downloader micro-benchmark - per-video overhead of YoutubeDL setup
+
+Serves small fake audio files from a local HTTP server and downloads them
+through AudioDownloader twice: once building a new YoutubeDL for every
+video (the old behaviour) and once with the pooled, reused instances.
+Nothing touches YouTube, so the difference is pure client overhead
+(extractor setup, connection handling).
+
+Usage:
+    python benchmark_downloader.py
+    python benchmark_downloader.py --videos 200 --workers 4 --size-kb 64
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+os.chdir(project_root)
+
+import yt_dlp
+from channel_transcriber import AudioDownloader, ProgressTracker, VideoInfo
+
+
+class FakeAudioHandler(BaseHTTPRequestHandler):
+    """Answers /<id>.webm with payload_size bytes over keep-alive connections"""
+    protocol_version = 'HTTP/1.1'
+    payload = b''
+
+    def _send_headers(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'audio/webm')
+        self.send_header('Content-Length', str(len(self.payload)))
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._send_headers()
+
+    def do_GET(self):
+        self._send_headers()
+        self.wfile.write(self.payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PerVideoDownloader(AudioDownloader):
+    """The old behaviour: a fresh YoutubeDL for every download"""
+
+    def _checkout_ydl(self):
+        return yt_dlp.YoutubeDL(self._ydl_options())
+
+    def _checkin_ydl(self, ydl):
+        ydl.close()
+
+
+def run(downloader_class, base_url, video_count, workers, work_dir):
+    """Download video_count files; returns wall-clock seconds"""
+    tracker = ProgressTracker(db_path=str(Path(work_dir) / "bench.db"), synchronous="OFF")
+    videos = [
+        VideoInfo(f"v{i:010d}", f"{base_url}/v{i:010d}.webm", f"Video {i}", 60, "Benchmark")
+        for i in range(video_count)
+    ]
+    tracker.add_videos(videos)
+    downloader = downloader_class(output_dir=str(Path(work_dir) / "audio"), max_workers=workers)
+
+    start = time.perf_counter()
+    paths = downloader.download_batch([v.__dict__ for v in videos], tracker)
+    elapsed = time.perf_counter() - start
+
+    downloader.close()
+    tracker.close()
+    if len(paths) != video_count:
+        print(f"[!] Only {len(paths)}/{video_count} downloads succeeded")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-video YoutubeDL overhead")
+    parser.add_argument('--videos', type=int, default=100, help="Downloads per run (default: 100)")
+    parser.add_argument('--workers', type=int, default=1, help="Parallel downloads (default: 1)")
+    parser.add_argument('--size-kb', type=int, default=32, help="Size of each fake file (default: 32)")
+    parser.add_argument('--rounds', type=int, default=3, help="Runs per mode; the best is reported")
+    args = parser.parse_args()
+
+    # Quiet the per-video log lines from AudioDownloader
+    import logging
+    logging.basicConfig(level=logging.WARNING)
+
+    FakeAudioHandler.payload = os.urandom(args.size_kb * 1024)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeAudioHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    print("=" * 70)
+    print("DOWNLOADER OVERHEAD BENCHMARK")
+    print("=" * 70)
+    print(f"Videos: {args.videos}  Workers: {args.workers}  File size: {args.size_kb} KB  Rounds: {args.rounds}")
+    print()
+
+    results = {}
+    for name, downloader_class in (("new YoutubeDL per video", PerVideoDownloader),
+                                   ("pooled YoutubeDL", AudioDownloader)):
+        best = None
+        for _ in range(args.rounds):
+            with tempfile.TemporaryDirectory() as work_dir:
+                elapsed = run(downloader_class, base_url, args.videos, args.workers, work_dir)
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+        print(f"{name:<26} {best:7.2f}s total  {best / args.videos * 1000:7.1f} ms/video")
+
+    server.shutdown()
+
+    before, after = results.values()
+    print("-" * 70)
+    print(f"Saved {(before - after) / args.videos * 1000:.1f} ms/video ({(1 - after / before) * 100:.0f}% faster)")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import sys
+from datetime import datetime
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "config"))
 
@@ -16,12 +17,45 @@ cursor.execute('''
 ''')
 
 error_videos = cursor.fetchall()
+
+# Databases written by newer versions record why each download failed
+cursor.execute("SELECT 1 FROM pragma_table_info('videos') WHERE name = 'error_class'")
+error_classes = []
+if cursor.fetchone():
+    cursor.execute('''
+        SELECT COALESCE(error_class, 'unclassified'), COUNT(*)
+        FROM videos
+        WHERE status = 'error'
+        GROUP BY 1
+        ORDER BY 2 DESC
+    ''')
+    error_classes = cursor.fetchall()
+
+# ... and when a later run will retry it automatically
+scheduled = (0, None)
+cursor.execute("SELECT 1 FROM pragma_table_info('videos') WHERE name = 'next_retry_at'")
+if cursor.fetchone():
+    cursor.execute('''
+        SELECT COUNT(*), MIN(next_retry_at)
+        FROM videos
+        WHERE status = 'error' AND next_retry_at IS NOT NULL
+    ''')
+    scheduled = cursor.fetchone()
 conn.close()
 
 print("\n" + "="*70)
 print(f"VIDEOS THAT FAILED TO DOWNLOAD (status='error'): {len(error_videos)}")
 print("="*70)
 
+if error_classes:
+    print("\nBy cause:")
+    for error_class, count in error_classes:
+        print(f"  {error_class:<15} {count}")
+
+if scheduled[0]:
+    print(f"\nScheduled for automatic retry: {scheduled[0]} "
+          f"(next due {datetime.fromtimestamp(scheduled[1]):%Y-%m-%d %H:%M})")
+
 if len(error_videos) > 0:
     print(f"\nFirst 20 error videos:")
     for i, row in enumerate(error_videos[:20]):
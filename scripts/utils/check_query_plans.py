@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Query Plan Checker - make sure hot database queries use indexes
+
+Runs EXPLAIN QUERY PLAN on the queries the transcriber and the status
+scripts run most often, and fails if any of them falls back to a full
+table scan, or if a paged query sorts in a temp B-tree instead of
+reading rows in index order. Run it after changing queries or the schema.
+
+By default it checks a fresh database built from the current schema, so
+it works without any data. Pass --db to check an existing database
+(e.g. after ANALYZE on a large one).
+
+Usage:
+    python check_query_plans.py
+    python check_query_plans.py --db data/transcription_progress.db
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from channel_transcriber import ProgressTracker, SCHEDULING_POLICIES, POLICY_ORDER_BY, KEYSET_ORDER
+
+
+def keyset_policies(policy):
+    """The keyset orders iter_pending_videos() pages through for a policy"""
+    if policy == 'interleaved':
+        # Walks a longest-first and a shortest-first keyset towards each other
+        return ('longest_first', 'shortest_first')
+    return (policy,)
+
+
+def hot_queries(tracker):
+    """
+    (name, sql, params, ordered) for each query that must not scan the whole
+    table; ordered queries must also get their ORDER BY from an index
+    """
+    queries = []
+    for policy in SCHEDULING_POLICIES:
+        # get_pending_videos() merges three statuses, so it sorts once in memory
+        sql, params = tracker._pending_query("Some Channel", policy)
+        queries.append((f"pending videos for channel ({policy})", sql, params, False))
+        sql, params = tracker._pending_query(None, policy)
+        queries.append((f"pending videos, all channels ({policy})", sql, params, False))
+
+    # iter_pending_videos() pages, built by the same helper the tracker runs
+    for policy in POLICY_ORDER_BY:
+        for keyset_policy in keyset_policies(policy):
+            key_columns, _ = KEYSET_ORDER[keyset_policy]
+            last_key = [0] * (len(key_columns) - 1) + ['abcdefghijk']
+            for channel in ("Some Channel", None):
+                for status in ('pending', 'downloaded'):
+                    for page, key in (("first", None), ("next", last_key)):
+                        sql, params = tracker._keyset_query(status, channel, keyset_policy, 500, key)
+                        scope = "for channel" if channel else "all channels"
+                        name = f"pending videos keyset {page} page, {status}, {scope} ({keyset_policy})"
+                        queries.append((name, sql, params, True))
+
+    # MetadataBackfill batch of videos with unknown duration
+    queries.append(("unknown durations", '''
+        SELECT video_id, url
+        FROM videos
+        WHERE status IN (?, ?, ?) AND duration = 0
+          AND (metadata_checked_at IS NULL OR metadata_checked_at < ?)
+        LIMIT 100
+    ''', ('downloaded', 'downloading', 'pending', 0), False))
+
+    # requeue_due_retries() at the start of each run
+    queries.append(("download retries due", '''
+        SELECT video_id FROM videos
+        WHERE next_retry_at <= ? AND status = 'error'
+    ''', (0,), False))
+
+    # get_stats() reads the trigger-maintained summary table
+    queries.append(("channel stats", '''
+        SELECT status, SUM(video_count), SUM(total_duration)
+        FROM channel_stats
+        WHERE channel = ?
+        GROUP BY status
+    ''', ("Some Channel",), False))
+
+    # check_progress.py "recently completed"
+    queries.append(("recently completed", '''
+        SELECT title, duration, updated_at
+        FROM videos
+        WHERE status = 'completed'
+        ORDER BY updated_at DESC
+        LIMIT 10
+    ''', (), True))
+
+    # Orchestrator final summary
+    queries.append(("completed transcripts", '''
+        SELECT transcript_path FROM videos
+        WHERE status = 'completed' AND transcript_path IS NOT NULL
+    ''', (), False))
+
+    return queries
+
+
+def is_full_scan(detail):
+    """A plain 'SCAN videos' reads every row; scans of an index are fine"""
+    return detail.startswith("SCAN") and "videos" in detail and "INDEX" not in detail
+
+
+def plan_problems(plan, ordered):
+    """Plan lines that break a hot query's budget"""
+    return [detail for detail in plan
+            if is_full_scan(detail) or (ordered and "USE TEMP B-TREE" in detail)]
+
+
+def main():
+    os.chdir(project_root)
+    if len(sys.argv) > 2 and sys.argv[1] == '--db':
+        db_path = sys.argv[2]
+        if not Path(db_path).exists():
+            print(f"Database not found: {db_path}")
+            sys.exit(1)
+        temp_dir = None
+    else:
+        temp_dir = tempfile.TemporaryDirectory()
+        db_path = str(Path(temp_dir.name) / "plan_check.db")
+
+    # A duration range makes the pending queries include the filter clause
+    tracker = ProgressTracker(db_path=db_path, min_duration=60, max_duration=4 * 3600)
+
+    print("=" * 80)
+    print("QUERY PLAN CHECK")
+    print("=" * 80)
+
+    failures = 0
+    for name, sql, params, ordered in hot_queries(tracker):
+        plan = tracker.explain(sql, params)
+        problems = plan_problems(plan, ordered)
+        if problems:
+            failures += 1
+        print(f"\n[{'SLOW' if problems else 'OK'}] {name}")
+        for detail in plan:
+            print(f"    {detail}")
+
+    tracker.close()
+    if temp_dir:
+        temp_dir.cleanup()
+
+    print("\n" + "=" * 80)
+    if failures:
+        print(f"[X] {failures} queries scan the whole videos table or sort without an index")
+        sys.exit(1)
+    print("[OK] All hot queries use an index")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import sys
+from datetime import datetime
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "config"))
 
@@ -8,8 +9,15 @@ import sqlite3
 conn = sqlite3.connect('data/transcription_progress.db')
 cursor = conn.cursor()
 
-cursor.execute('''
-    SELECT video_id, title, url
+# Newer databases also track failed runs and the next automatic retry
+cursor.execute("SELECT 1 FROM pragma_table_info('videos') WHERE name = 'next_retry_at'")
+if cursor.fetchone():
+    retry_columns = "download_attempts, next_retry_at"
+else:
+    retry_columns = "0, NULL"
+
+cursor.execute(f'''
+    SELECT video_id, title, url, {retry_columns}
     FROM videos
     WHERE status = 'error'
     ORDER BY video_id
@@ -17,7 +25,7 @@ cursor.execute('''
 
 print("\n215 FAILED DOWNLOADS - Complete List")
 print("=" * 100)
-print(f"{'Video ID':<20} {'Title':<60} {'URL'}")
+print(f"{'Video ID':<20} {'Title':<60} {'Runs':>4}  {'Next retry':<16} {'URL'}")
 print("-" * 100)
 
 error_videos = cursor.fetchall()
@@ -25,7 +33,8 @@ for row in error_videos:
     video_id = row[0]
     title = (row[1][:57] + "...") if row[1] and len(row[1]) > 60 else (row[1] or "Unknown")
     url = row[2] or ""
-    print(f"{video_id:<20} {title:<60} {url}")
+    next_retry = datetime.fromtimestamp(row[4]).strftime('%Y-%m-%d %H:%M') if row[4] else "-"
+    print(f"{video_id:<20} {title:<60} {row[3] or 0:>4}  {next_retry:<16} {url}")
 
 print("\n" + "=" * 100)
 print(f"Total error videos: {len(error_videos)}")
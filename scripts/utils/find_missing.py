@@ -1,40 +1,38 @@
 import sys
+import os
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent / "config"))
 
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "config"))
+os.chdir(project_root)
+
+import config
 from config import CHANNEL_URL
-import yt_dlp
+from channel_transcriber import ChannelScraper, ScrapeCache
 
 print("\n" + "="*70)
 print("FINDING VIDEOS NOT DOWNLOADED")
 print("="*70)
 
-# 1. Get all videos from YouTube channel
+# 1. Get all videos from YouTube channel (reuses a recent cached listing)
 print("\nFetching all videos from YouTube channel...")
-channel_url = CHANNEL_URL.rstrip('/') + '/videos'
-
-ydl_opts = {
-    'quiet': True,
-    'no_warnings': True,
-    'extract_flat': 'in_playlist',
-    'playlistend': 10000,
-}
+cache_ttl_hours = getattr(config, 'SCRAPE_CACHE_TTL_HOURS', 0)
+cache = None
+if cache_ttl_hours:
+    cache = ScrapeCache(getattr(config, 'SCRAPE_CACHE_DIR', 'data/scrape_cache'), ttl_seconds=cache_ttl_hours * 3600)
+scraper = ChannelScraper(CHANNEL_URL, tabs=tuple(getattr(config, 'SCRAPE_TABS', ['videos'])), cache=cache)
 
 youtube_video_ids = []
 youtube_video_titles = {}
 
 try:
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(channel_url, download=False)
-        entries = info.get('entries', [])
-
-        for entry in entries:
-            if entry and entry.get('id') and entry.get('_type') == 'url':
-                vid_id = entry.get('id')
-                youtube_video_ids.append(vid_id)
-                youtube_video_titles[vid_id] = entry.get('title', 'Unknown')
+    for video in scraper.iter_videos():
+        youtube_video_ids.append(video.video_id)
+        youtube_video_titles[video.video_id] = video.title
 
-        print(f"YouTube channel has: {len(youtube_video_ids)} videos")
+    print(f"YouTube channel has: {len(youtube_video_ids)} videos")
 except Exception as e:
     print(f"Error fetching channel: {e}")
     sys.exit(1)
@@ -74,6 +74,7 @@ def reset_channel(channel_name):
     print("  - Set status to 'pending'")
     print("  - Clear audio_path")
     print("  - Clear transcript_path")
+    print("  - Clear download retry history")
     print()
 
     response = input("Continue? (y/N): ")
@@ -92,8 +93,18 @@ def reset_channel(channel_name):
         WHERE channel = ?
     ''', (channel_name,))
 
-    conn.commit()
     updated = cursor.rowcount
+
+    # Databases written by newer versions schedule automatic download retries
+    cursor.execute("SELECT 1 FROM pragma_table_info('videos') WHERE name = 'next_retry_at'")
+    if cursor.fetchone():
+        cursor.execute('''
+            UPDATE videos
+            SET download_attempts = 0, next_retry_at = NULL, error_class = NULL
+            WHERE channel = ?
+        ''', (channel_name,))
+
+    conn.commit()
     conn.close()
 
     print(f"\n✅ Reset {updated} videos for '{channel_name}'")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Simulate scheduling policies for the current pending set
+
+Predicts how long transcription of the pending videos will take under each
+scheduling policy, so you can pick SCHEDULING_POLICY and TRANSCRIBE_WORKERS
+before starting a long run. Videos are taken in the order a run would work
+through them (downloaded, then in-progress, then pending, each in policy
+order), within the configured duration range. The database is opened
+read-only; nothing is downloaded or transcribed.
+
+Usage:
+    python simulate_schedule.py                      # All channels, config settings
+    python simulate_schedule.py "Channel Name"       # One channel
+    python simulate_schedule.py --workers 4 --speed 30
+"""
+
+import sys
+import os
+import argparse
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "config"))
+os.chdir(project_root)
+
+import config
+from channel_transcriber import (
+    ProgressTracker,
+    SCHEDULING_POLICIES,
+    simulate_makespan
+)
+
+
+def format_hours(seconds):
+    """Format seconds as hours and minutes"""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Predict makespan for each scheduling policy")
+    parser.add_argument('channel', nargs='?', help="Only simulate this channel")
+    parser.add_argument('--workers', type=int, default=max(1, getattr(config, 'TRANSCRIBE_WORKERS', 1)),
+                        help="Parallel transcription workers (default: TRANSCRIBE_WORKERS)")
+    parser.add_argument('--speed', type=float, default=getattr(config, 'REALTIME_FACTOR', 35),
+                        help="Transcription speed in x realtime (default: REALTIME_FACTOR)")
+    args = parser.parse_args()
+
+    if not Path(config.DATABASE_FILE).exists():
+        print(f"Database not found: {config.DATABASE_FILE}")
+        sys.exit(1)
+
+    tracker = ProgressTracker(
+        db_path=config.DATABASE_FILE,
+        min_duration=getattr(config, 'MIN_VIDEO_DURATION_MINUTES', 0) * 60,
+        max_duration=getattr(config, 'MAX_VIDEO_DURATION_MINUTES', 0) * 60,
+        read_only=True
+    )
+
+    print("\n" + "=" * 70)
+    print("SCHEDULE SIMULATION")
+    print("=" * 70)
+    print(f"Channel:  {args.channel or 'all channels'}")
+    print(f"Workers:  {args.workers}")
+    print(f"Speed:    {args.speed:.0f}x realtime")
+
+    results = []
+    for policy in SCHEDULING_POLICIES:
+        videos = tracker.iter_pending_videos(channel_filter=args.channel, policy=policy)
+        durations = [v['duration'] or 0 for v in videos]
+        results.append((policy, simulate_makespan(durations, args.workers, args.speed)))
+
+    tracker.close()
+
+    total_audio = sum(durations)
+    unknown = sum(1 for d in durations if not d)
+    print(f"Pending:  {len(durations)} videos, {format_hours(total_audio)} of audio")
+    if unknown:
+        print(f"          ({unknown} videos have unknown duration and count as 0)")
+    print()
+
+    if not durations:
+        print("Nothing pending.")
+        return
+
+    # Lower bound: perfectly balanced work, or the single longest video
+    lower_bound = max(total_audio / args.speed / args.workers, max(durations) / args.speed)
+    configured = getattr(config, 'SCHEDULING_POLICY', 'shortest_first')
+
+    print(f"{'Policy':<16} {'Makespan':>10} {'vs. ideal':>10}")
+    print("-" * 40)
+    for policy, makespan in sorted(results, key=lambda r: r[1]):
+        overhead = max(0.0, (makespan / lower_bound - 1) * 100) if lower_bound else 0
+        marker = "  <- configured" if policy == configured else ""
+        print(f"{policy:<16} {format_hours(makespan):>10} {overhead:>9.1f}%{marker}")
+    print("-" * 40)
+    print(f"{'ideal':<16} {format_hours(lower_bound):>10}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
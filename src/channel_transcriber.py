@@ -8,16 +8,27 @@ import os
 import sys
 import json
 import sqlite3
-from faster_whisper import WhisperModel
+from faster_whisper import WhisperModel, decode_audio
 import yt_dlp
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Iterator, Iterable
 import logging
 import time
 import threading
+import queue
+import shutil
+import multiprocessing
+import heapq
+import socket
+import itertools
+from collections import OrderedDict, deque
+import gzip
+import hashlib
+import random
 
 # Set ffmpeg path BEFORE importing whisper's audio functions
 try:
@@ -40,22 +51,191 @@ class VideoInfo:
     title: str
     duration: int
     channel: str
+    source_tab: str = 'videos'  # Channel tab the video was listed on (videos, shorts, streams)
+
+
+# Processing orders supported by ProgressTracker.get_pending_videos
+#   shortest_first - quick wins first (original behaviour)
+#   longest_first  - long videos first so no multi-hour straggler is left for the
+#                    end; minimizes wall-clock time with several workers
+#   interleaved    - alternate longest and shortest; long jobs start early while
+#                    short ones keep completions flowing
+#   priority       - by the videos.priority column (highest first), then longest first
+SCHEDULING_POLICIES = ('shortest_first', 'longest_first', 'interleaved', 'priority')
+
+# Bumped whenever ProgressTracker._migrate gains a step (stored in PRAGMA user_version)
+SCHEMA_VERSION = 14
+
+# ORDER BY clause for each scheduling policy ('interleaved' is finished in Python)
+POLICY_ORDER_BY = {
+    'shortest_first': 'duration ASC',
+    'longest_first': 'duration DESC',
+    'interleaved': 'duration DESC',
+    'priority': 'priority DESC, duration DESC',
+}
+
+# Work stages for ProgressTracker.claim_next: (ready status, in-progress status)
+CLAIM_STAGES = {
+    'download': ('pending', 'downloading'),
+    'transcribe': ('downloaded', 'transcribing'),
+}
+IN_PROGRESS_STATUSES = tuple(active for _, active in CLAIM_STAGES.values())
+
+# error_message on rows the duration filter moved to 'skipped' (so they can be
+# restored when the filter is relaxed)
+DURATION_SKIP_REASON = "Outside configured duration range"
+
+# Statuses still needing work, in the order iter_pending_videos visits them.
+# Rows only ever move towards earlier entries (pending -> downloading ->
+# downloaded) or leave the set, so a status-by-status walk never sees a row twice.
+PENDING_STATUSES = ('downloaded', 'downloading', 'pending')
+
+# Keyset columns and direction used by iter_pending_videos for each policy
+KEYSET_ORDER = {
+    'shortest_first': (('duration', 'video_id'), 'ASC'),
+    'longest_first': (('duration', 'video_id'), 'DESC'),
+    'priority': (('priority', 'duration', 'video_id'), 'DESC'),
+}
+# Columns each keyset page selects (priority is only needed for the key)
+KEYSET_COLUMNS = ('video_id', 'url', 'title', 'duration', 'channel', 'source_tab', 'priority')
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this pid is running on this host"""
+    if pid == os.getpid():
+        return True
+    if os.name == 'nt':
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        exit_code = ctypes.c_ulong()
+        try:
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+        finally:
+            kernel32.CloseHandle(handle)
+        return exit_code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Someone else's process
+    return True
+
+
+def safe_filename(name: str, max_length: int = 100) -> str:
+    """Keep letters, digits, spaces, '-' and '_' so a channel name or title can be a path component"""
+    return "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()[:max_length]
+
+
+def interleave_by_duration(videos: List[dict]) -> List[dict]:
+    """Reorder videos as longest, shortest, 2nd longest, 2nd shortest, ..."""
+    ordered = sorted(videos, key=lambda v: v.get('duration') or 0, reverse=True)
+    result = []
+    lo, hi = 0, len(ordered) - 1
+    while lo <= hi:
+        result.append(ordered[lo])
+        if lo != hi:
+            result.append(ordered[hi])
+        lo += 1
+        hi -= 1
+    return result
+
+
+def simulate_makespan(durations: Iterable[float], workers: int = 1, realtime_factor: float = 1.0) -> float:
+    """
+    Predict wall-clock seconds to process jobs in the given order
+    Each job goes to whichever worker frees up first (greedy list scheduling),
+    taking duration / realtime_factor seconds.
+    """
+    workers = max(1, workers)
+    finish_times = [0.0] * workers
+    for duration in durations:
+        start = heapq.heappop(finish_times)
+        heapq.heappush(finish_times, start + (duration or 0) / realtime_factor)
+    return max(finish_times)
 
 
 class ProgressTracker:
     """SQLite-based progress tracker for resumability"""
 
-    def __init__(self, db_path: str = "transcription_progress.db"):
+    def __init__(self, db_path: str = "transcription_progress.db", wal: bool = True,
+                 synchronous: str = "FULL", commit_interval: float = 0.0,
+                 worker_id: str = None, lease_seconds: float = 3600,
+                 min_duration: float = 0, max_duration: float = 0, read_only: bool = False):
+        """
+        Args:
+            db_path: SQLite database file
+            wal: Use write-ahead logging so readers (check_progress.py etc.) never
+                block writers and vice versa
+            synchronous: SQLite synchronous level (OFF, NORMAL, FULL, EXTRA).
+                NORMAL in WAL mode survives application crashes but may lose
+                the last commits on power loss
+            commit_interval: Seconds between group commits of status updates.
+                0 commits every update immediately (fully durable); > 0 lets a
+                background thread batch updates, losing at most this much on a crash
+            worker_id: Identifies this process in claimed rows (default host:pid)
+            lease_seconds: Lease taken when update_status moves a row into an
+                in-progress state; expired leases are handed to other workers
+            min_duration, max_duration: Seconds; videos of known duration outside
+                this range are stored as 'skipped' and never downloaded (0 = no limit)
+            read_only: Open an existing database for queries only - no schema
+                migrations and no journal mode change, so it is safe to point
+                at a database another process is using
+        """
         self.db_path = db_path
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.min_duration = min_duration
+        self.max_duration = max_duration
 
-        # Create parent directory if it doesn't exist
-        db_dir = Path(db_path).parent
-        if db_dir and str(db_dir) != '.':
-            db_dir.mkdir(parents=True, exist_ok=True)
+        synchronous = synchronous.upper()
+        if synchronous not in ('OFF', 'NORMAL', 'FULL', 'EXTRA'):
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
 
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self._lock = threading.Lock()  # Add thread lock for database operations
-        self._create_tables()
+        if read_only:
+            self.conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True,
+                                        check_same_thread=False, timeout=30)
+        else:
+            # Create parent directory if it doesn't exist
+            db_dir = Path(db_path).parent
+            if db_dir and str(db_dir) != '.':
+                db_dir.mkdir(parents=True, exist_ok=True)
+
+            # Wait for other processes' transactions instead of failing with "database is locked"
+            self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+            if wal:
+                self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute(f'PRAGMA synchronous={synchronous}')
+            self._create_tables()
+
+        # Group commit: update_status executes immediately (so this connection
+        # reads its own writes) but commits are batched by a background thread
+        self.commit_interval = commit_interval
+        self._dirty = False
+        self._closed = threading.Event()
+        self._committer = None
+        if commit_interval > 0:
+            self._committer = threading.Thread(target=self._commit_loop, name="db-committer", daemon=True)
+            self._committer.start()
+
+    def _commit_loop(self):
+        """Commit pending updates every commit_interval seconds"""
+        while not self._closed.wait(self.commit_interval):
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                logger.warning(f"Group commit failed, will retry: {e}")
+
+    def flush(self):
+        """Commit any status updates still waiting for a group commit"""
+        with self._lock:
+            if self._dirty:
+                self.conn.commit()
+                self._dirty = False
 
     def _create_tables(self):
         """Create database tables if they don't exist"""
@@ -75,26 +255,351 @@ class ProgressTracker:
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
+        self._migrate(cursor)
         self.conn.commit()
 
+    def _migrate(self, cursor):
+        """Bring databases created by older versions up to SCHEMA_VERSION"""
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+
+        if version < 1:
+            self._add_column_if_missing(cursor, 'videos', 'priority', 'INTEGER DEFAULT 0')
+
+        if version < 2:
+            # Pending queue: status filter, ordered by duration (optionally per channel);
+            # the channel index also covers per-channel stats
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_status_duration ON videos(status, duration)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_channel_status_duration ON videos(channel, status, duration)')
+            # "Recently completed" reports
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_status_updated ON videos(status, updated_at)')
+
+        if version < 3:
+            self._create_channel_stats(cursor)
+
+        if version < 4:
+            # Work leases for claim_next()
+            self._add_column_if_missing(cursor, 'videos', 'claimed_by', 'TEXT')
+            self._add_column_if_missing(cursor, 'videos', 'lease_expires_at', 'REAL')
+
+        if version < 5:
+            # Keyset pagination orders by (duration, video_id); NULLs would
+            # break the row-value comparisons, and unknown durations were
+            # already stored as 0 by some scrapes
+            cursor.execute('UPDATE videos SET duration = 0 WHERE duration IS NULL')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_status_duration_id ON videos(status, duration, video_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_channel_status_duration_id ON videos(channel, status, duration, video_id)')
+            cursor.execute('DROP INDEX IF EXISTS idx_videos_status_duration')
+            cursor.execute('DROP INDEX IF EXISTS idx_videos_channel_status_duration')
+
+        if version < 6:
+            # One row per stage attempt (download, decode, transcribe)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS video_metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    video_id TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    success INTEGER NOT NULL DEFAULT 1,
+                    seconds REAL,
+                    bytes INTEGER,
+                    audio_seconds REAL,
+                    realtime_factor REAL,
+                    worker_id TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_video_metrics_video ON video_metrics(video_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_video_metrics_stage ON video_metrics(stage, created_at)')
+
+        if version < 7:
+            # Per-channel high-water mark for incremental scraping (epoch seconds)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS scrape_state (
+                    channel_url TEXT PRIMARY KEY,
+                    newest_video_id TEXT,
+                    last_scrape_at REAL,
+                    last_full_scrape_at REAL
+                )
+            ''')
+
+        if version < 8:
+            # Channel tab each video was scraped from; older rows all came from /videos
+            self._add_column_if_missing(cursor, 'videos', 'source_tab', "TEXT DEFAULT 'videos'")
+
+        if version < 9:
+            # When MetadataBackfill last tried to look up a missing duration
+            self._add_column_if_missing(cursor, 'videos', 'metadata_checked_at', 'REAL')
+
+        if version < 10:
+            # Download concurrency limit in force when a download finished
+            self._add_column_if_missing(cursor, 'video_metrics', 'concurrency', 'INTEGER')
+
+        if version < 11:
+            # classify_download_error() result for the last failed download
+            self._add_column_if_missing(cursor, 'videos', 'error_class', 'TEXT')
+
+        if version < 12:
+            # Cross-run download retries: failed runs so far and when the
+            # next run may try again (NULL = not scheduled)
+            self._add_column_if_missing(cursor, 'videos', 'download_attempts', 'INTEGER DEFAULT 0')
+            self._add_column_if_missing(cursor, 'videos', 'next_retry_at', 'REAL')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_next_retry ON videos(next_retry_at) '
+                           'WHERE next_retry_at IS NOT NULL')
+
+        if version < 13:
+            # Audio stream picked by the format ladder, and its size saving
+            # over the highest-bitrate audio stream
+            self._add_column_if_missing(cursor, 'videos', 'audio_format', 'TEXT')
+            self._add_column_if_missing(cursor, 'videos', 'bytes_saved', 'INTEGER')
+
+        if version < 14:
+            # Keyset pages for the 'priority' policy; all key columns run DESC,
+            # so an ascending index is simply walked backwards
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_status_priority_duration_id '
+                           'ON videos(status, priority, duration, video_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_videos_channel_status_priority_duration_id '
+                           'ON videos(channel, status, priority, duration, video_id)')
+
+        if version < SCHEMA_VERSION:
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _create_channel_stats(self, cursor):
+        """
+        Per-channel, per-status counters kept in sync by triggers
+        Lets get_stats() read a handful of rows instead of aggregating the
+        whole videos table. NULL channels are stored as ''.
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS channel_stats (
+                channel TEXT NOT NULL,
+                status TEXT NOT NULL,
+                video_count INTEGER NOT NULL DEFAULT 0,
+                total_duration INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (channel, status)
+            )
+        ''')
+
+        increment = '''
+            INSERT INTO channel_stats (channel, status, video_count, total_duration)
+            VALUES (COALESCE(NEW.channel, ''), COALESCE(NEW.status, ''), 1, COALESCE(NEW.duration, 0))
+            ON CONFLICT (channel, status) DO UPDATE SET
+                video_count = video_count + 1,
+                total_duration = total_duration + excluded.total_duration;
+        '''
+        decrement = '''
+            UPDATE channel_stats SET
+                video_count = video_count - 1,
+                total_duration = total_duration - COALESCE(OLD.duration, 0)
+            WHERE channel = COALESCE(OLD.channel, '') AND status = COALESCE(OLD.status, '');
+        '''
+
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_videos_stats_insert
+            AFTER INSERT ON videos
+            BEGIN {increment} END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_videos_stats_delete
+            AFTER DELETE ON videos
+            BEGIN {decrement} END
+        ''')
+        # Only fires when a counted column actually changes, not on every
+        # updated_at bump
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_videos_stats_update
+            AFTER UPDATE OF status, channel, duration ON videos
+            WHEN OLD.status IS NOT NEW.status
+              OR OLD.channel IS NOT NEW.channel
+              OR OLD.duration IS NOT NEW.duration
+            BEGIN {decrement} {increment} END
+        ''')
+
+        # Backfill from existing rows
+        cursor.execute('DELETE FROM channel_stats')
+        cursor.execute('''
+            INSERT INTO channel_stats (channel, status, video_count, total_duration)
+            SELECT COALESCE(channel, ''), COALESCE(status, ''), COUNT(*), COALESCE(SUM(duration), 0)
+            FROM videos
+            GROUP BY COALESCE(channel, ''), COALESCE(status, '')
+        ''')
+
+    def _add_column_if_missing(self, cursor, table: str, column: str, definition: str):
+        """Add a column to databases created by older versions"""
+        cursor.execute(f'PRAGMA table_info({table})')
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+
     def add_video(self, video: VideoInfo):
         """Add a video to the database"""
+        self.add_videos([video])
+
+    _INSERT_VIDEO = '''
+        INSERT OR IGNORE INTO videos
+            (video_id, url, title, duration, channel, source_tab, status, error_message)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+
+    def _video_row(self, v: VideoInfo) -> tuple:
+        """Insert parameters for a scraped video (out-of-range durations start as 'skipped')"""
+        if self.in_duration_range(v.duration):
+            status, reason = 'pending', None
+        else:
+            status, reason = 'skipped', DURATION_SKIP_REASON
+        return (v.video_id, v.url, v.title, v.duration or 0, v.channel, v.source_tab, status, reason)
+
+    def add_videos(self, videos: List[VideoInfo]) -> int:
+        """
+        Add many videos in a single transaction
+        Returns the number of videos that were new (already-known IDs are ignored)
+        """
+        rows = [self._video_row(v) for v in videos]
+
         with self._lock:
             cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT OR IGNORE INTO videos (video_id, url, title, duration, channel, status)
-                VALUES (?, ?, ?, ?, ?, 'pending')
-            ''', (video.video_id, video.url, video.title, video.duration, video.channel))
+            cursor.executemany(self._INSERT_VIDEO, rows)
+            self.conn.commit()
+            # rowcount excludes the channel_stats trigger writes (total_changes doesn't)
+            return max(cursor.rowcount, 0)
+
+    def add_new_videos(self, videos: List[VideoInfo]) -> List[VideoInfo]:
+        """
+        Like add_videos, but returns the videos that were new
+        Still one transaction; rows go in one at a time so each insert's
+        rowcount tells whether the ID was already known.
+        """
+        new = []
+        with self._lock:
+            cursor = self.conn.cursor()
+            for v in videos:
+                cursor.execute(self._INSERT_VIDEO, self._video_row(v))
+                if cursor.rowcount > 0:
+                    new.append(v)
+            self.conn.commit()
+        return new
+
+    def in_duration_range(self, duration: Optional[float]) -> bool:
+        """True unless the duration is known and outside min_duration..max_duration"""
+        if not duration:
+            return True  # Unknown durations are never filtered
+        if self.min_duration and duration < self.min_duration:
+            return False
+        if self.max_duration and duration > self.max_duration:
+            return False
+        return True
+
+    def _duration_filter(self):
+        """SQL condition (and params) keeping rows inside the duration range, or None"""
+        outside, params = [], []
+        if self.min_duration:
+            outside.append('duration < ?')
+            params.append(self.min_duration)
+        if self.max_duration:
+            outside.append('duration > ?')
+            params.append(self.max_duration)
+        if not outside:
+            return None, []
+        return f"NOT (duration > 0 AND ({' OR '.join(outside)}))", params
+
+    def apply_duration_filter(self) -> tuple:
+        """
+        Re-apply the duration range to rows already in the database
+        Pending videos outside the range become 'skipped'; videos skipped by an
+        earlier, stricter range go back to 'pending'.
+        Returns (skipped, restored) counts.
+        """
+        keep, params = self._duration_filter()
+        with self._lock:
+            cursor = self.conn.cursor()
+            skipped = 0
+            if keep:
+                cursor.execute(f'''
+                    UPDATE videos SET status = 'skipped', error_message = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE status = 'pending' AND NOT ({keep})
+                ''', [DURATION_SKIP_REASON] + params)
+                skipped = cursor.rowcount
+            cursor.execute(f'''
+                UPDATE videos SET status = 'pending', error_message = NULL, updated_at = CURRENT_TIMESTAMP
+                WHERE status = 'skipped' AND error_message = ?{f' AND {keep}' if keep else ''}
+            ''', [DURATION_SKIP_REASON] + params)
+            restored = cursor.rowcount
+            self.conn.commit()
+        return skipped, restored
+
+    def get_unknown_durations(self, checked_before: float, limit: int = 500,
+                              statuses: tuple = PENDING_STATUSES) -> List[dict]:
+        """
+        Videos whose duration is still unknown (0) and that haven't been looked up since checked_before
+        Uses the (status, duration) index, so it stays cheap on large tables.
+        """
+        placeholders = ', '.join('?' * len(statuses))
+        cursor = self.conn.cursor()
+        cursor.execute(f'''
+            SELECT video_id, url
+            FROM videos
+            WHERE status IN ({placeholders}) AND duration = 0
+              AND (metadata_checked_at IS NULL OR metadata_checked_at < ?)
+            LIMIT ?
+        ''', (*statuses, checked_before, limit))
+        return [{'video_id': row[0], 'url': row[1]} for row in cursor.fetchall()]
+
+    def set_durations(self, durations: List[tuple]):
+        """Store looked-up (video_id, duration) pairs; a None duration only records the attempt"""
+        now = time.time()
+        with self._lock:
+            self.conn.executemany('''
+                UPDATE videos SET
+                    duration = COALESCE(?, duration),
+                    metadata_checked_at = ?
+                WHERE video_id = ?
+            ''', [(int(duration) if duration else None, now, video_id) for video_id, duration in durations])
+            self.conn.commit()
+
+    def known_video_ids(self) -> set:
+        """IDs of every video already in the database (used to stop incremental scrapes)"""
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT video_id FROM videos')
+        return {row[0] for row in cursor.fetchall()}
+
+    def get_scrape_state(self, channel_url: str) -> Optional[dict]:
+        """High-water mark left by the last scrape of channel_url, or None if never scraped"""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT newest_video_id, last_scrape_at, last_full_scrape_at
+            FROM scrape_state WHERE channel_url = ?
+        ''', (channel_url,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return {'newest_video_id': row[0], 'last_scrape_at': row[1], 'last_full_scrape_at': row[2]}
+
+    def record_scrape(self, channel_url: str, newest_video_id: Optional[str], full: bool):
+        """Move the high-water mark after a successful scrape"""
+        now = time.time()
+        with self._lock:
+            self.conn.execute('''
+                INSERT INTO scrape_state (channel_url, newest_video_id, last_scrape_at, last_full_scrape_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(channel_url) DO UPDATE SET
+                    newest_video_id = COALESCE(excluded.newest_video_id, newest_video_id),
+                    last_scrape_at = excluded.last_scrape_at,
+                    last_full_scrape_at = COALESCE(excluded.last_full_scrape_at, last_full_scrape_at)
+            ''', (channel_url, newest_video_id, now, now if full else None))
             self.conn.commit()
 
     def update_status(self, video_id: str, status: str, **kwargs):
-        """Update video status and optional fields"""
+        """Update video status and optional fields
+
+        Moving into an in-progress status takes a lease for this tracker's
+        worker_id; any other status releases it.
+        """
         with self._lock:
             cursor = self.conn.cursor()
 
             # Build dynamic update query
-            fields = ['status = ?', 'updated_at = CURRENT_TIMESTAMP']
-            values = [status]
+            fields = ['status = ?', 'updated_at = CURRENT_TIMESTAMP', 'claimed_by = ?', 'lease_expires_at = ?']
+            if status in IN_PROGRESS_STATUSES:
+                values = [status, self.worker_id, time.time() + self.lease_seconds]
+            else:
+                values = [status, None, None]
 
             for key, value in kwargs.items():
                 fields.append(f'{key} = ?')
@@ -104,34 +609,454 @@ class ProgressTracker:
             query = f"UPDATE videos SET {', '.join(fields)} WHERE video_id = ?"
 
             cursor.execute(query, values)
+            self._commit_or_defer()
+
+    def _commit_or_defer(self):
+        """Commit now, or leave it to the group-commit thread (call with _lock held)"""
+        if self.commit_interval > 0:
+            self._dirty = True
+        else:
             self.conn.commit()
 
-    def get_pending_videos(self, channel_filter: str = None) -> List[dict]:
+    def record_metric(self, video_id: str, stage: str, seconds: float, size_bytes: int = None,
+                      audio_seconds: float = None, success: bool = True, concurrency: int = None):
+        """
+        Record timing for one stage attempt ('download', 'decode', 'transcribe')
+        realtime_factor is derived as audio_seconds / seconds when both are known.
+        """
+        realtime_factor = None
+        if audio_seconds and seconds and seconds > 0:
+            realtime_factor = audio_seconds / seconds
+
+        with self._lock:
+            self.conn.execute('''
+                INSERT INTO video_metrics
+                    (video_id, stage, success, seconds, bytes, audio_seconds, realtime_factor, worker_id, concurrency)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (video_id, stage, int(success), seconds, size_bytes, audio_seconds, realtime_factor,
+                  self.worker_id, concurrency))
+            self._commit_or_defer()
+
+    def get_stage_metrics(self, since: str = None) -> dict:
+        """
+        Aggregate timings per stage
+        Returns {stage: {attempts, failures, seconds, bytes, audio_seconds,
+        avg_seconds, mb_per_second, realtime_factor, avg_concurrency}}; since is an optional
+        'YYYY-MM-DD HH:MM:SS' (UTC) lower bound on created_at.
+        """
+        query = '''
+            SELECT stage,
+                   COUNT(*),
+                   SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END),
+                   SUM(seconds),
+                   SUM(bytes),
+                   SUM(CASE WHEN success = 1 THEN audio_seconds ELSE 0 END),
+                   SUM(CASE WHEN success = 1 THEN seconds ELSE 0 END),
+                   AVG(concurrency)
+            FROM video_metrics
+        '''
+        params = ()
+        if since:
+            query += ' WHERE created_at >= ?'
+            params = (since,)
+        query += ' GROUP BY stage'
+
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        metrics = {}
+        for stage, attempts, failures, seconds, total_bytes, audio_seconds, ok_seconds, concurrency in cursor.fetchall():
+            seconds = seconds or 0
+            metrics[stage] = {
+                'attempts': attempts,
+                'failures': failures or 0,
+                'seconds': seconds,
+                'bytes': total_bytes or 0,
+                'audio_seconds': audio_seconds or 0,
+                'avg_seconds': seconds / attempts if attempts else 0,
+                'mb_per_second': (total_bytes or 0) / 1e6 / seconds if seconds else 0,
+                'realtime_factor': (audio_seconds or 0) / ok_seconds if ok_seconds else 0,
+                'avg_concurrency': concurrency or 0,
+            }
+        return metrics
+
+    def _pending_query(self, channel_filter: str = None, policy: str = "shortest_first"):
+        """Build the pending-videos query; returns (sql, params)"""
+        if policy not in SCHEDULING_POLICIES:
+            raise ValueError(f"Unknown scheduling policy: {policy} (choose from {', '.join(SCHEDULING_POLICIES)})")
+
+        order_by = POLICY_ORDER_BY[policy]
+
+        # IN (rather than OR) lets SQLite use the (status, duration) indexes.
+        # Rows another worker holds a live lease on are skipped.
+        where = ("status IN ('pending', 'downloading', 'downloaded')"
+                 " AND (lease_expires_at IS NULL OR lease_expires_at < ?)")
+        params = (time.time(),)
+        if channel_filter:
+            where += " AND channel = ?"
+            params += (channel_filter,)
+        # Only videos not yet downloaded are held to the duration range
+        keep, keep_params = self._duration_filter()
+        if keep:
+            where += f" AND (status != 'pending' OR {keep})"
+            params += tuple(keep_params)
+
+        sql = f'''
+            SELECT video_id, url, title, duration, channel, source_tab
+            FROM videos
+            WHERE {where}
+            ORDER BY {order_by}
+        '''
+        return sql, params
+
+    def get_pending_videos(self, channel_filter: str = None, policy: str = "shortest_first") -> List[dict]:
         """Get all videos that haven't been processed yet
 
         Args:
             channel_filter: Optional channel name to filter by. If None, returns all channels.
+            policy: Processing order, one of SCHEDULING_POLICIES
         """
         cursor = self.conn.cursor()
+        cursor.execute(*self._pending_query(channel_filter, policy))
 
+        columns = ['video_id', 'url', 'title', 'duration', 'channel', 'source_tab']
+        videos = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        if policy == 'interleaved':
+            videos = interleave_by_duration(videos)
+        return videos
+
+    def _keyset_query(self, status: str, channel_filter: str, policy: str, page_size: int,
+                      last_key: list = None):
+        """Build one iter_pending_videos page query; returns (sql, params)"""
+        key_columns, direction = KEYSET_ORDER[policy]
+        comparison = '>' if direction == 'ASC' else '<'
+        key = ', '.join(key_columns)
+        order_by = ', '.join(f'{column} {direction}' for column in key_columns)
+
+        where = 'status = ? AND (lease_expires_at IS NULL OR lease_expires_at < ?)'
+        params = [status, time.time()]
         if channel_filter:
-            cursor.execute('''
-                SELECT video_id, url, title, duration, channel
-                FROM videos
-                WHERE (status = 'pending' OR status = 'downloading' OR status = 'downloaded')
-                  AND channel = ?
-                ORDER BY duration ASC
-            ''', (channel_filter,))
+            where += ' AND channel = ?'
+            params.append(channel_filter)
+        keep, keep_params = self._duration_filter()
+        if keep and status == 'pending':
+            where += f' AND {keep}'
+            params.extend(keep_params)
+        if last_key is not None:
+            where += f' AND ({key}) {comparison} ({", ".join("?" * len(key_columns))})'
+            params.extend(last_key)
+
+        sql = f'''
+            SELECT {', '.join(KEYSET_COLUMNS)}
+            FROM videos
+            WHERE {where}
+            ORDER BY {order_by}
+            LIMIT ?
+        '''
+        return sql, params + [page_size]
+
+    def _iter_keyset(self, status: str, channel_filter: str, policy: str, page_size: int) -> Iterator[dict]:
+        """Yield one status's pending rows page by page, seeking past the last key"""
+        key_columns, _ = KEYSET_ORDER[policy]
+        last_key = None
+        while True:
+            cursor = self.conn.cursor()
+            cursor.execute(*self._keyset_query(status, channel_filter, policy, page_size, last_key))
+            rows = cursor.fetchall()
+
+            for row in rows:
+                video = dict(zip(KEYSET_COLUMNS, row))
+                last_key = [video[column] for column in key_columns]
+                del video['priority']
+                yield video
+
+            if len(rows) < page_size:
+                return
+
+    def _iter_interleaved(self, status: str, channel_filter: str, page_size: int) -> Iterator[dict]:
+        """Alternate the longest and shortest remaining rows until the two ends meet"""
+        longest = self._iter_keyset(status, channel_filter, 'longest_first', page_size)
+        shortest = self._iter_keyset(status, channel_filter, 'shortest_first', page_size)
+        high_key = (float('inf'), '')
+        low_key = (float('-inf'), '')
+        seen_low = set()
+
+        for long_video in longest:
+            high_key = (long_video['duration'], long_video['video_id'])
+            if high_key < low_key or long_video['video_id'] in seen_low:
+                return
+            yield long_video
+
+            short_video = next(shortest, None)
+            if short_video is None:
+                return
+            low_key = (short_video['duration'], short_video['video_id'])
+            if low_key >= high_key:
+                return
+            seen_low.add(short_video['video_id'])
+            yield short_video
+
+    def iter_pending_videos(self, channel_filter: str = None, policy: str = "shortest_first",
+                            page_size: int = 500, statuses: tuple = PENDING_STATUSES) -> Iterator[dict]:
+        """
+        Stream videos that still need work without loading them all into memory
+
+        Pages through the table by keyset (status, then the policy's sort key,
+        then video_id). Every policy's key has a matching index, so each page
+        is an index seek with no sort step, and rows whose status changes
+        mid-iteration are neither skipped nor repeated. Already
+        downloaded videos come first, then in-progress ones, then pending.
+
+        Args:
+            channel_filter: Optional channel name to filter by
+            policy: Processing order within each status, one of SCHEDULING_POLICIES
+            page_size: Rows fetched per query
+            statuses: Which statuses to include, visited in this order
+        """
+        if policy not in SCHEDULING_POLICIES:
+            raise ValueError(f"Unknown scheduling policy: {policy} (choose from {', '.join(SCHEDULING_POLICIES)})")
+
+        for status in statuses:
+            if policy == 'interleaved':
+                yield from self._iter_interleaved(status, channel_filter, page_size)
+            else:
+                yield from self._iter_keyset(status, channel_filter, policy, page_size)
+
+    def get_status_counts(self, channel_filter: str = None) -> dict:
+        """Video count and total duration (seconds) for every status, from channel_stats"""
+        cursor = self.conn.cursor()
+        query = 'SELECT status, SUM(video_count), SUM(total_duration) FROM channel_stats'
+        if channel_filter:
+            cursor.execute(query + ' WHERE channel = ? GROUP BY status', (channel_filter,))
         else:
+            cursor.execute(query + ' GROUP BY status')
+        return {status: {'count': count, 'duration': duration}
+                for status, count, duration in cursor.fetchall() if count}
+
+    def explain(self, sql: str, params: tuple = ()) -> List[str]:
+        """Return SQLite's EXPLAIN QUERY PLAN details for a query"""
+        cursor = self.conn.cursor()
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+    def _dead_local_claimants(self, cursor, now: float) -> List[str]:
+        """Worker ids (host:pid) on this host holding live leases whose process has exited"""
+        cursor.execute('''
+            SELECT DISTINCT claimed_by FROM videos
+            WHERE status IN ('downloading', 'transcribing') AND lease_expires_at >= ?
+        ''', (now,))
+        host = socket.gethostname()
+        dead = []
+        for (claimant,) in cursor.fetchall():
+            claim_host, _, pid = (claimant or '').rpartition(':')
+            if claim_host == host and pid.isdigit() and not _pid_alive(int(pid)):
+                dead.append(claimant)
+        return dead
+
+    def _reclaim(self, cursor, now: float, include_unleased: bool = False, claimants: List[str] = ()) -> int:
+        """
+        Return rows with expired leases to their stage's ready status
+        Leases held by crashed processes on this host count as expired, as
+        do all leases of the given claimants.
+        """
+        conditions = ['lease_expires_at < ?']
+        params = [now]
+        if include_unleased:
+            conditions.append('lease_expires_at IS NULL')
+        claimants = list(claimants) + self._dead_local_claimants(cursor, now)
+        if claimants:
+            conditions.append(f'claimed_by IN ({", ".join("?" * len(claimants))})')
+            params.extend(claimants)
+        lease_condition = f'({" OR ".join(conditions)})'
+        cursor.execute(f'''
+            UPDATE videos SET
+                status = CASE
+                    WHEN status = 'transcribing' AND audio_path IS NOT NULL THEN 'downloaded'
+                    ELSE 'pending'
+                END,
+                claimed_by = NULL,
+                lease_expires_at = NULL,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE status IN ('downloading', 'transcribing') AND {lease_condition}
+        ''', params)
+        return cursor.rowcount
+
+    def get_bytes_saved(self) -> tuple:
+        """(videos, bytes) saved by the audio format ladder across all downloads"""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT COUNT(*), SUM(bytes_saved) FROM videos WHERE bytes_saved IS NOT NULL'
+            ).fetchone()
+        return row[0], row[1] or 0
+
+    def record_download_error(self, video_id: str, error_message: str, error_class: str = None,
+                              retry_delays: tuple = ()) -> Optional[float]:
+        """
+        Mark a download failed and schedule the next run's retry
+        download_attempts counts failed runs; after the n-th one the video is
+        retried retry_delays[n - 1] seconds later, and never once the delays
+        run out (pass () for permanent errors). Returns next_retry_at or None.
+        """
+        with self._lock:
+            row = self.conn.execute('SELECT download_attempts FROM videos WHERE video_id = ?',
+                                    (video_id,)).fetchone()
+        attempts = (row[0] or 0) + 1 if row else 1
+        next_retry_at = None
+        if attempts <= len(retry_delays):
+            next_retry_at = time.time() + retry_delays[attempts - 1]
+        self.update_status(video_id, 'error', error_message=error_message, error_class=error_class,
+                           download_attempts=attempts, next_retry_at=next_retry_at)
+        return next_retry_at
+
+    def requeue_due_retries(self) -> int:
+        """
+        Put failed downloads whose next_retry_at has passed back to 'pending'
+        Failures not yet due stay 'error' until a later run.
+        Returns the number of videos requeued.
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self.conn.cursor()
             cursor.execute('''
-                SELECT video_id, url, title, duration, channel
-                FROM videos
-                WHERE status = 'pending' OR status = 'downloading' OR status = 'downloaded'
-                ORDER BY duration ASC
-            ''')
+                UPDATE videos
+                SET status = 'pending', next_retry_at = NULL, updated_at = CURRENT_TIMESTAMP
+                WHERE next_retry_at <= ? AND status = 'error'
+            ''', (now,))
+            requeued = cursor.rowcount
+            cursor.execute('''
+                SELECT COUNT(*), MIN(next_retry_at) FROM videos
+                WHERE next_retry_at > ? AND status = 'error'
+            ''', (now,))
+            waiting, next_due = cursor.fetchone()
+            self.conn.commit()
+            self._dirty = False
+
+        if requeued:
+            logger.info(f"Retrying {requeued} failed downloads that are due")
+        if waiting:
+            logger.info(f"{waiting} failed downloads wait for a later run "
+                        f"(next due {datetime.fromtimestamp(next_due):%Y-%m-%d %H:%M})")
+        return requeued
+
+    def reclaim_expired_leases(self, include_unleased: bool = False) -> int:
+        """
+        Hand work abandoned by crashed workers back to the queue
+        Covers expired leases and leases held by processes on this host that
+        have exited (e.g. a run killed mid-download). include_unleased also recovers in-progress rows without a lease (left
+        by versions before leases existed); only use it when no such process
+        is still running. Returns the number of rows reclaimed.
+        """
+        with self._lock:
+            cursor = self.conn.cursor()
+            reclaimed = self._reclaim(cursor, time.time(), include_unleased)
+            self.conn.commit()
+            self._dirty = False
+        if reclaimed:
+            logger.info(f"Reclaimed {reclaimed} videos from expired or abandoned work")
+        return reclaimed
+
+    def release_leases(self) -> int:
+        """
+        Hand this worker's unfinished rows back to the queue
+        Call on exit (including Ctrl+C) so the next run doesn't have to wait
+        for the leases to expire. Returns the number of rows released.
+        """
+        with self._lock:
+            cursor = self.conn.cursor()
+            released = self._reclaim(cursor, time.time(), claimants=[self.worker_id])
+            self.conn.commit()
+            self._dirty = False
+        if released:
+            logger.info(f"Released {released} unfinished videos back to the queue")
+        return released
 
-        columns = ['video_id', 'url', 'title', 'duration', 'channel']
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    def claim_next(self, stage: str, worker_id: str = None, lease_seconds: float = 600,
+                   channel_filter: str = None, policy: str = "shortest_first") -> Optional[dict]:
+        """
+        Atomically claim the next video for a stage ('download' or 'transcribe')
+
+        The row moves to the stage's in-progress status with a lease that
+        expires after lease_seconds; call renew_lease() for longer work.
+        Expired leases are reclaimed first, so work from crashed workers is
+        picked up again. Safe across threads and processes sharing the
+        database (BEGIN IMMEDIATE serializes claimers).
+
+        Returns the video dict (including audio_path) or None when nothing is ready.
+        """
+        if stage not in CLAIM_STAGES:
+            raise ValueError(f"Unknown stage: {stage} (choose from {', '.join(CLAIM_STAGES)})")
+        if policy not in SCHEDULING_POLICIES:
+            raise ValueError(f"Unknown scheduling policy: {policy} (choose from {', '.join(SCHEDULING_POLICIES)})")
+        ready_status, active_status = CLAIM_STAGES[stage]
+        worker_id = worker_id or self.worker_id
+
+        where = 'status = ?'
+        params = (ready_status,)
+        if channel_filter:
+            where += ' AND channel = ?'
+            params += (channel_filter,)
+        keep, keep_params = self._duration_filter()
+        if keep and ready_status == 'pending':
+            where += f' AND {keep}'
+            params += tuple(keep_params)
+
+        with self._lock:
+            # Finish any pending group commit; BEGIN can't nest
+            if self.conn.in_transaction:
+                self.conn.commit()
+            self._dirty = False
+
+            cursor = self.conn.cursor()
+            now = time.time()
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                self._reclaim(cursor, now)
+                cursor.execute(f'''
+                    SELECT video_id, url, title, duration, channel, audio_path
+                    FROM videos
+                    WHERE {where}
+                    ORDER BY {POLICY_ORDER_BY[policy]}
+                    LIMIT 1
+                ''', params)
+                row = cursor.fetchone()
+                if row:
+                    cursor.execute('''
+                        UPDATE videos SET
+                            status = ?, claimed_by = ?, lease_expires_at = ?,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE video_id = ?
+                    ''', (active_status, worker_id, now + lease_seconds, row[0]))
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+        if not row:
+            return None
+        columns = ['video_id', 'url', 'title', 'duration', 'channel', 'audio_path']
+        return dict(zip(columns, row))
+
+    def renew_lease(self, video_id: str, worker_id: str = None, lease_seconds: float = 600) -> bool:
+        """Extend a claim; returns False if the lease was lost to another worker"""
+        worker_id = worker_id or self.worker_id
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute('''
+                UPDATE videos SET lease_expires_at = ?
+                WHERE video_id = ? AND claimed_by = ?
+            ''', (time.time() + lease_seconds, video_id, worker_id))
+            self.conn.commit()
+            self._dirty = False
+            return cursor.rowcount == 1
+
+    def set_priority(self, video_ids: List[str], priority: int):
+        """Set scheduling priority for videos (higher runs first under the 'priority' policy)"""
+        with self._lock:
+            self.conn.executemany(
+                'UPDATE videos SET priority = ? WHERE video_id = ?',
+                [(priority, video_id) for video_id in video_ids]
+            )
+            self.conn.commit()
 
     def get_stats(self, channel_filter: str = None) -> dict:
         """Get current processing statistics
@@ -141,29 +1066,23 @@ class ProgressTracker:
         """
         cursor = self.conn.cursor()
 
+        # channel_stats is maintained by triggers, so this reads one row per
+        # (channel, status) no matter how many videos there are
+        query = '''
+            SELECT
+                SUM(video_count) as total,
+                SUM(CASE WHEN status = 'completed' THEN video_count ELSE 0 END) as completed,
+                SUM(CASE WHEN status = 'error' THEN video_count ELSE 0 END) as errors,
+                SUM(CASE WHEN status = 'pending' THEN video_count ELSE 0 END) as pending,
+                SUM(total_duration) as total_duration,
+                SUM(CASE WHEN status = 'completed' THEN total_duration ELSE 0 END) as completed_duration,
+                SUM(CASE WHEN status = 'skipped' THEN video_count ELSE 0 END) as skipped
+            FROM channel_stats
+        '''
         if channel_filter:
-            cursor.execute('''
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                    SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) as errors,
-                    SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                    SUM(duration) as total_duration,
-                    SUM(CASE WHEN status = 'completed' THEN duration ELSE 0 END) as completed_duration
-                FROM videos
-                WHERE channel = ?
-            ''', (channel_filter,))
+            cursor.execute(query + ' WHERE channel = ?', (channel_filter,))
         else:
-            cursor.execute('''
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                    SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) as errors,
-                    SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                    SUM(duration) as total_duration,
-                    SUM(CASE WHEN status = 'completed' THEN duration ELSE 0 END) as completed_duration
-                FROM videos
-            ''')
+            cursor.execute(query)
 
         row = cursor.fetchone()
         return {
@@ -172,30 +1091,243 @@ class ProgressTracker:
             'errors': row[2] or 0,
             'pending': row[3] or 0,
             'total_hours': (row[4] or 0) / 3600,
-            'completed_hours': (row[5] or 0) / 3600
+            'completed_hours': (row[5] or 0) / 3600,
+            'skipped': row[6] or 0
         }
 
     def close(self):
-        """Close database connection"""
+        """Commit pending updates and close database connection"""
+        self._closed.set()
+        if self._committer:
+            self._committer.join()
+        self.flush()
+        try:
+            # Refresh index statistics if the table changed a lot this run
+            self.conn.execute('PRAGMA optimize')
+        except sqlite3.Error:
+            pass
         self.conn.close()
 
 
+# Channel tabs ChannelScraper can enumerate
+CHANNEL_TABS = ('videos', 'shorts', 'streams')
+
+
+class ScrapeCache:
+    """
+    Gzipped JSON channel listings on disk, shared by every script that scrapes
+    Within ttl_seconds a listing is reused without touching YouTube. Once it
+    goes stale, ChannelScraper refreshes it conditionally: only the newest
+    uploads are fetched (until refresh_stop_after cached videos in a row are
+    seen) and merged on top of the cached listing.
+    """
+
+    def __init__(self, cache_dir: str = "data/scrape_cache", ttl_seconds: float = 6 * 3600,
+                 refresh_stop_after: int = 50):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.refresh_stop_after = refresh_stop_after
+
+    def _path(self, channel_url: str, tabs: tuple) -> Path:
+        key = f"{channel_url.rstrip('/')}|{','.join(sorted(tabs))}"
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.json.gz"
+
+    def load(self, channel_url: str, tabs: tuple) -> Optional[dict]:
+        """
+        Cached listing for a channel, fresh or stale
+        Returns {channel_url, channel_name, fetched_at, videos} or None
+        """
+        path = self._path(channel_url, tabs)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+            entry['videos'] = [
+                VideoInfo(video_id, f"https://www.youtube.com/watch?v={video_id}", title, duration,
+                          entry['channel_name'], source_tab)
+                for video_id, title, duration, source_tab in entry['videos']
+            ]
+        except (OSError, EOFError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable scrape cache {path}: {e}")
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry['fetched_at'] < self.ttl_seconds
+
+    def save(self, channel_url: str, tabs: tuple, channel_name: str, videos: List[VideoInfo]):
+        """Write a listing atomically (readers never see a half-written file)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(channel_url, tabs)
+        entry = {
+            'channel_url': channel_url,
+            'tabs': list(tabs),
+            'channel_name': channel_name,
+            'fetched_at': time.time(),
+            'videos': [[v.video_id, v.title, v.duration, v.source_tab] for v in videos]
+        }
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f, separators=(',', ':'))
+        os.replace(temp_path, path)
+
+
 class ChannelScraper:
     """Scrapes all video URLs and metadata from a YouTube channel"""
 
-    def __init__(self, channel_url: str):
+    def __init__(self, channel_url: str, tabs: tuple = ('videos',), cache: Optional[ScrapeCache] = None):
+        unknown = [tab for tab in tabs if tab not in CHANNEL_TABS]
+        if not tabs:
+            raise ValueError("At least one channel tab is required")
+        if unknown:
+            raise ValueError(f"Unknown channel tabs: {unknown} (choose from {', '.join(CHANNEL_TABS)})")
         self.channel_url = channel_url
+        self.tabs = tuple(dict.fromkeys(tabs))
+        self.cache = cache
+        self.channel_name = None
+        self.newest_video_id = None  # First (newest) upload seen by the last scrape
+        self._stopped_tabs = set()  # Tabs the last live scrape stopped paging early
+        self.complete_listing = False  # Last scrape enumerated every tab live, to the end
+
+    def _tab_url(self, tab: str) -> str:
+        """Channel URL for one tab, whichever tab (if any) the configured URL points at"""
+        url = self.channel_url.rstrip('/')
+        head, _, last = url.rpartition('/')
+        if last in CHANNEL_TABS:
+            url = head
+        return f"{url}/{tab}"
+
+    def scrape(self, known_ids: Optional[set] = None, stop_after_known: int = 0,
+               use_cache: bool = True) -> List[VideoInfo]:
+        """
+        Scrape videos from the channel, newest first
+        Returns list of VideoInfo objects (see iter_videos for the arguments)
+        """
+        return list(self.iter_videos(known_ids, stop_after_known, use_cache))
 
-    def scrape(self) -> List[VideoInfo]:
+    def iter_videos(self, known_ids: Optional[set] = None, stop_after_known: int = 0,
+                    use_cache: bool = True) -> Iterator[VideoInfo]:
         """
-        Scrape all videos from the channel
-        Returns list of VideoInfo objects
+        Yield videos from the channel as playlist pages arrive
+        With several tabs, each tab is enumerated in its own thread and the
+        results are merged; a video listed on more than one tab is yielded
+        once, tagged with the tab it was first seen on.
+
+        With a cache, a fresh cached listing is yielded without any network
+        access and a stale one is refreshed by fetching only new uploads
+        (the cached IDs stand in for known_ids). Complete listings are
+        written back once the generator has been consumed.
+
+        complete_listing is set once the generator has been consumed, and
+        only when every tab was paged live to the end - cache hits, stale
+        refreshes and early stops leave it False.
+
+        Args:
+            known_ids: Video IDs already in the database
+            stop_after_known: With known_ids, stop paging a tab once this many
+                consecutive known videos have been seen (incremental scrape).
+                0 enumerates the whole channel.
+            use_cache: False fetches the full listing live (and re-caches it)
         """
-        # Ensure we're scraping the /videos tab to get all uploads
-        channel_url = self.channel_url
-        if not channel_url.endswith('/videos'):
-            channel_url = channel_url.rstrip('/') + '/videos'
+        self.channel_name = None
+        self.newest_video_id = None
+        self._stopped_tabs = set()
+        self.complete_listing = False
+
+        cached = None
+        if self.cache and use_cache:
+            cached = self.cache.load(self.channel_url, self.tabs)
+            if cached and self.cache.is_fresh(cached):
+                age_minutes = (time.time() - cached['fetched_at']) / 60
+                logger.info(f"Using cached channel listing: {len(cached['videos'])} videos, "
+                            f"{age_minutes:.0f} min old")
+                self.channel_name = cached['channel_name']
+                if cached['videos']:
+                    self.newest_video_id = cached['videos'][0].video_id
+                yield from cached['videos']
+                return
+            if cached:
+                logger.info("Cached channel listing is stale - fetching new uploads only")
+                known_ids = {v.video_id for v in cached['videos']}
+                stop_after_known = stop_after_known or self.cache.refresh_stop_after
+            else:
+                # Nothing cached yet: take the full listing once so it can be cached
+                known_ids, stop_after_known = None, 0
+
+        live = []
+        for video in self._iter_live(known_ids, stop_after_known):
+            live.append(video)
+            yield video
+
+        listing = live
+        self.complete_listing = not cached and not self._stopped_tabs
+        if cached:
+            fetched = {v.video_id for v in live}
+            rest = [v for v in cached['videos'] if v.video_id not in fetched]
+            yield from rest
+            listing = live + rest
+            self.channel_name = self.channel_name or cached['channel_name']
+
+        # A live scrape that stopped early only saw part of the channel
+        if self.cache and listing and (cached or not self._stopped_tabs):
+            self.cache.save(self.channel_url, self.tabs, self.channel_name, listing)
+
+    def _iter_live(self, known_ids: Optional[set], stop_after_known: int) -> Iterator[VideoInfo]:
+        """Fetch the selected tabs from YouTube, deduplicated across tabs"""
+        if len(self.tabs) == 1:
+            videos = self._iter_tab(self.tabs[0], known_ids, stop_after_known)
+        else:
+            videos = self._iter_tabs_concurrently(known_ids, stop_after_known)
 
+        seen = set()
+        for video in videos:
+            if video.video_id in seen:
+                continue
+            seen.add(video.video_id)
+            if self.newest_video_id is None:
+                self.newest_video_id = video.video_id
+            yield video
+
+        if len(self.tabs) > 1:
+            logger.info(f"Scraped {len(seen)} unique videos from tabs: {', '.join(self.tabs)}")
+
+    def _iter_tabs_concurrently(self, known_ids: Optional[set], stop_after_known: int) -> Iterator[VideoInfo]:
+        """Enumerate every tab in parallel and yield videos as any tab produces them"""
+        found = queue.Queue()
+        done = object()
+        stop = threading.Event()
+
+        def scrape_tab(tab: str):
+            try:
+                for video in self._iter_tab(tab, known_ids, stop_after_known):
+                    if stop.is_set():
+                        return
+                    found.put(video)
+            except Exception as e:
+                found.put(e)
+            finally:
+                found.put(done)
+
+        for tab in self.tabs:
+            threading.Thread(target=scrape_tab, args=(tab,), name=f"scrape-{tab}", daemon=True).start()
+
+        remaining = len(self.tabs)
+        try:
+            while remaining:
+                item = found.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+
+    def _iter_tab(self, tab: str, known_ids: Optional[set], stop_after_known: int) -> Iterator[VideoInfo]:
+        """Yield one tab's videos, newest first, fetching playlist pages lazily"""
+        channel_url = self._tab_url(tab)
         logger.info(f"Scraping channel: {channel_url}")
 
         ydl_opts = {
@@ -207,20 +1339,33 @@ class ChannelScraper:
             'ignoreerrors': True,  # Continue on errors
         }
 
-        videos = []
+        incremental = bool(known_ids) and stop_after_known > 0
+        consecutive_known = 0
+        scraped = 0
+        new_count = 0
+        stopped_early = False
 
         try:
+            # One YoutubeDL per tab - instances aren't shared between threads
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                logger.info("Fetching channel information...")
-                result = ydl.extract_info(channel_url, download=False)
-
-                if 'entries' not in result:
-                    logger.error("No videos found in channel")
-                    return videos
+                logger.info(f"Fetching channel information ({tab})...")
+                # process=False leaves 'entries' as a lazy generator, so playlist
+                # pages are only fetched while we keep iterating
+                result = ydl.extract_info(channel_url, download=False, process=False)
+                if result and result.get('_type') in ('url', 'url_transparent'):
+                    result = ydl.extract_info(result['url'], download=False, process=False)
+
+                if not result or 'entries' not in result:
+                    if tab == 'videos':
+                        logger.error("No videos found in channel")
+                    else:
+                        logger.info(f"Channel has no {tab} tab")
+                    return
 
                 channel_name = result.get('channel', result.get('uploader', 'Unknown'))
-                logger.info(f"Channel: {channel_name}")
-                logger.info(f"Found {len(result['entries'])} videos")
+                if self.channel_name is None:
+                    self.channel_name = channel_name
+                    logger.info(f"Channel: {channel_name}")
 
                 for entry in result['entries']:
                     if entry is None:
@@ -241,89 +1386,639 @@ class ChannelScraper:
                         url=f"https://www.youtube.com/watch?v={video_id}",
                         title=entry.get('title', 'Unknown'),
                         duration=entry.get('duration', 0),
-                        channel=channel_name
+                        channel=channel_name,
+                        source_tab=tab
                     )
-                    videos.append(video)
-
-                logger.info(f"Successfully scraped {len(videos)} videos")
+                    scraped += 1
+                    yield video
+
+                    if incremental:
+                        if video_id in known_ids:
+                            consecutive_known += 1
+                        else:
+                            consecutive_known = 0
+                            new_count += 1
+                        if consecutive_known >= stop_after_known:
+                            stopped_early = True
+                            break
+
+                if stopped_early:
+                    self._stopped_tabs.add(tab)
+                    logger.info(f"Reached {stop_after_known} consecutive known videos on {tab} - "
+                                f"stopping after {scraped} ({new_count} new)")
+                else:
+                    logger.info(f"Successfully scraped {scraped} videos ({tab})")
 
         except Exception as e:
-            logger.error(f"Error scraping channel: {e}")
+            logger.error(f"Error scraping channel ({tab}): {e}")
             raise
 
-        return videos
+
+class MetadataBackfill:
+    """
+    Look up real durations for videos the flat channel listing left unknown
+    Runs bounded-concurrency metadata requests (no downloads) for pending
+    videos with duration 0, so scheduling, stats and ETAs use real numbers.
+    Results are stored in the database; lookups that fail are not retried
+    until retry_after_seconds have passed.
+    """
+
+    def __init__(self, tracker: ProgressTracker, max_workers: int = 8,
+                 retry_after_seconds: float = 7 * 86400, batch_size: int = 100):
+        self.tracker = tracker
+        self.max_workers = max(1, max_workers)
+        self.retry_after_seconds = retry_after_seconds
+        self.batch_size = batch_size
+        self._local = threading.local()
+
+    def _ydl(self):
+        """One YoutubeDL per worker thread, reused for every lookup it makes"""
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True, 'skip_download': True})
+            self._local.ydl = ydl
+        return ydl
+
+    def _fetch_duration(self, video: dict) -> tuple:
+        """(video_id, duration) - duration is None when the lookup fails"""
+        try:
+            # process=False skips format selection; the extractor's info has the duration
+            info = self._ydl().extract_info(video['url'], download=False, process=False)
+            return video['video_id'], (info or {}).get('duration')
+        except Exception as e:
+            logger.debug(f"Metadata lookup failed for {video['video_id']}: {e}")
+            return video['video_id'], None
+
+    def run(self, statuses: tuple = PENDING_STATUSES) -> tuple:
+        """
+        Backfill durations until no unchecked videos remain
+        Returns (found, failed) counts.
+        """
+        checked_before = time.time() - self.retry_after_seconds
+        found = failed = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                # Rows looked up in this pass get a fresh metadata_checked_at,
+                # so each query returns the next unchecked batch
+                batch = self.tracker.get_unknown_durations(checked_before, self.batch_size, statuses)
+                if not batch:
+                    break
+
+                results = list(executor.map(self._fetch_duration, batch))
+                self.tracker.set_durations(results)
+
+                batch_found = sum(1 for _, duration in results if duration)
+                found += batch_found
+                failed += len(results) - batch_found
+                logger.info(f"Duration backfill: {found} found, {failed} unavailable so far")
+
+        return found, failed
+
+
+class DiskBudget:
+    """
+    Byte budget and free-space floor for downloaded-but-untranscribed audio
+    Downloads call acquire() before starting and block until there is room.
+    In-flight downloads reserve an estimate based on video duration so that
+    several workers starting at once can't all slip under the limit.
+    Only files this run downloaded (add_file) count against the budget;
+    leftovers from earlier runs or failed steps in the same directory can
+    never hold it shut. A file stops counting once it has been deleted.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = 0, min_free_bytes: int = 0,
+                 bytes_per_second: int = 16_000, poll_interval: float = 5.0):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes  # 0 = no limit
+        self.min_free_bytes = min_free_bytes  # 0 = no floor
+        self.bytes_per_second = bytes_per_second  # ~128 kbps audio
+        self.poll_interval = poll_interval
+        self._reserved = 0
+        self._in_flight = 0
+        self._files = set()  # Downloaded files not yet transcribed (or deleted)
+        self._cond = threading.Condition()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 or self.min_free_bytes > 0
+
+    def estimate(self, video: dict) -> int:
+        """Estimate audio file size from video duration"""
+        return int((video.get('duration') or 0) * self.bytes_per_second)
+
+    def used_bytes(self) -> int:
+        """Bytes of downloaded files still on disk (in-flight downloads are covered by reservations)"""
+        total = 0
+        with self._cond:
+            for path in list(self._files):
+                try:
+                    total += os.path.getsize(path)
+                except OSError:
+                    # Transcribed (possibly by a worker process) or removed
+                    self._files.discard(path)
+        return total
+
+    def add_file(self, path: str):
+        """Count a finished download against the budget until it is deleted"""
+        with self._cond:
+            self._files.add(str(path))
+
+    def _has_room(self, needed: int) -> bool:
+        used = self.used_bytes()
+
+        # Always let one download through when nothing is pending, otherwise a
+        # single file larger than the budget would stall the pipeline forever
+        if used == 0 and self._in_flight == 0:
+            return True
+
+        if self.max_bytes and used + self._reserved + needed > self.max_bytes:
+            return False
+        if self.min_free_bytes:
+            free = shutil.disk_usage(self.directory).free
+            if free - self._reserved - needed < self.min_free_bytes:
+                return False
+        return True
+
+    def acquire(self, video: dict) -> int:
+        """Block until the video fits in the budget; returns the reservation"""
+        needed = self.estimate(video)
+        if not self.enabled:
+            return needed
+
+        with self._cond:
+            waited = False
+            while not self._has_room(needed):
+                if not waited:
+                    logger.info(f"Disk budget full, waiting for transcription to free space "
+                                f"({self.used_bytes() / 1e6:.0f} MB pending)")
+                    waited = True
+                self._cond.wait(timeout=self.poll_interval)
+            self._reserved += needed
+            self._in_flight += 1
+        return needed
+
+    def release(self, reserved: int):
+        """Drop a reservation once the download has finished (or failed)"""
+        with self._cond:
+            self._reserved = max(0, self._reserved - reserved)
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify_all()
+
+    def notify(self):
+        """Wake waiting downloads after audio files have been deleted"""
+        with self._cond:
+            self._cond.notify_all()
+
+
+# Download error classes, checked in order against the lowercased error
+# message; the first class with a matching substring wins
+DOWNLOAD_ERROR_MARKERS = (
+    ('throttling', ('http error 429', 'too many requests', 'rate-limit', 'rate limit',
+                    "confirm you're not a bot", 'confirm you’re not a bot')),
+    # Scheduled premieres and live streams (the streams tab lists them)
+    # that haven't started yet; checked before 'unavailable' on purpose
+    ('upcoming', ('premieres in', 'premiere will begin', 'this live event will begin',
+                  'live event will begin')),
+    ('age_restricted', ('confirm your age', 'age-restricted', 'age restricted',
+                        'inappropriate for some users')),
+    ('geo_blocked', ('not available in your country', 'not made this video available in your country',
+                     'geo restriction', 'geo-restricted', 'blocked it in your country')),
+    ('unavailable', ('private video', 'video is private', 'has been removed', 'video unavailable',
+                     'no longer available', 'account associated with this video has been terminated',
+                     'copyright claim', 'members-only', 'join this channel', 'http error 404')),
+    ('format_unavailable', ('requested format is not available',)),
+    ('network', ('timed out', 'timeout', 'connection reset', 'connection refused', 'connection aborted',
+                 'remote end closed', 'temporary failure in name resolution', 'name or service not known',
+                 'network is unreachable', 'incompleteread', 'unable to download webpage',
+                 'http error 500', 'http error 502', 'http error 503', 'http error 504',
+                 'bytes read', '[ssl', 'unable to download video data')),
+)
+
+# Classes worth retrying; the others fail the same way every time
+RETRYABLE_ERROR_CLASSES = ('throttling', 'network', 'unknown')
+
+# Upcoming events aren't retried within a run (they won't start in minutes)
+# but are requeued for later runs twice a day for two weeks, regardless of
+# the regular retry schedule
+UPCOMING_RETRY_DELAYS = (12 * 3600,) * 28
+
+# (base, cap) seconds of exponential backoff per retryable class
+RETRY_BACKOFF = {
+    'throttling': (30.0, 600.0),
+    'network': (2.0, 60.0),
+    'unknown': (5.0, 120.0),
+}
+
+
+def classify_download_error(error: BaseException) -> str:
+    """Map a download exception to one of DOWNLOAD_ERROR_MARKERS' classes, or 'unknown'"""
+    message = str(error).lower()
+    for error_class, markers in DOWNLOAD_ERROR_MARKERS:
+        if any(marker in message for marker in markers):
+            return error_class
+    if isinstance(error, (TimeoutError, ConnectionError, socket.timeout)):
+        return 'network'
+    return 'unknown'
+
+
+def retry_delay(error_class: str, attempt: int) -> float:
+    """Seconds to wait before retry number attempt (1-based): exponential backoff, half of it jittered"""
+    base, cap = RETRY_BACKOFF.get(error_class, RETRY_BACKOFF['unknown'])
+    delay = min(cap, base * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+# yt-dlp format selectors for AUDIO_FORMAT, tried left to right. All are
+# audio-only; Whisper resamples to 16 kHz mono anyway, so ~50 kbps opus
+# transcribes the same as the 160 kbps stream at a third of the size.
+AUDIO_FORMAT_LADDERS = {
+    # Smallest audio stream that is still fine for speech, opus preferred
+    # ("best" under the '+abr' sort below means lowest bitrate)
+    'speech': 'bestaudio[acodec=opus][abr>=40]/bestaudio[abr>=40]/bestaudio[acodec=opus]/bestaudio',
+    # Mid bitrate: up to ~96 kbps opus or 128 kbps AAC
+    'balanced': 'bestaudio[acodec=opus][abr<=96]/bestaudio[abr<=128]/bestaudio',
+    # Highest-bitrate audio stream (what the downloader always used)
+    'best': 'bestaudio',
+}
+
+# yt-dlp format_sort for each ladder. 'lang' must stay ahead of any size or
+# bitrate field: it ranks the original audio track above dubbed (-1) and
+# audio-description (-10) tracks, and the transcriber assumes English. A
+# 'worstaudio' selector would walk that order backwards and pick them.
+AUDIO_FORMAT_SORT = {
+    'speech': ['lang', '+abr'],
+    'balanced': ['lang'],
+    'best': ['lang'],
+}
+
+# Appended with allow_video: a low-resolution format that has audio
+# (never 'worst', which would also prefer the worst-ranked language)
+VIDEO_FALLBACK_FORMAT = 'best[acodec!=none][height<=480]/best[acodec!=none]'
+
+
+def audio_format_selector(policy: str = 'speech', allow_video: bool = False) -> str:
+    """
+    yt-dlp format string for a ladder name, or a custom selector passed through
+    Without allow_video, videos that only offer combined audio+video formats
+    fail with 'format_unavailable' instead of downloading the video.
+    """
+    selector = AUDIO_FORMAT_LADDERS.get(policy, policy)
+    if allow_video:
+        selector += '/' + VIDEO_FALLBACK_FORMAT
+    return selector
+
+
+def audio_format_sort(policy: str = 'speech') -> Optional[List[str]]:
+    """yt-dlp format_sort for a ladder name; None for custom selectors (yt-dlp's default order)"""
+    return AUDIO_FORMAT_SORT.get(policy)
+
+
+def _estimated_size(fmt: dict, duration: float) -> Optional[float]:
+    """Bytes of a yt-dlp format, from its reported size or bitrate"""
+    size = fmt.get('filesize') or fmt.get('filesize_approx')
+    if not size and duration and (fmt.get('abr') or fmt.get('tbr')):
+        size = (fmt.get('abr') or fmt.get('tbr')) * 1000 / 8 * duration
+    return size
+
+
+def format_bytes_saved(info: dict, size_bytes: int) -> Optional[int]:
+    """
+    Bytes saved by the chosen stream versus the largest audio-only stream
+    (the one plain 'bestaudio' picks); None when the listing has no sizes
+    """
+    duration = info.get('duration')
+    sizes = [
+        _estimated_size(fmt, duration)
+        for fmt in info.get('formats') or []
+        if fmt.get('vcodec') == 'none' and fmt.get('acodec') not in (None, 'none')
+    ]
+    sizes = [size for size in sizes if size]
+    if not sizes:
+        return None
+    return max(0, int(max(sizes)) - size_bytes)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on concurrent downloads
+    After each window of finished downloads (one per slot), the limit grows
+    by one if aggregate throughput beat the previous window. A throttling
+    error (429, bot check) or a transfer crawling below slow_bytes_per_second
+    cuts it by decrease_factor, at most once per window. Like TCP congestion
+    control, it probes upward slowly and backs off fast.
+    """
+
+    def __init__(self, initial: int, maximum: int, minimum: int = 1, decrease_factor: float = 0.5,
+                 slow_bytes_per_second: float = 100_000, improvement: float = 0.05):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.decrease_factor = decrease_factor
+        self.slow_bytes_per_second = slow_bytes_per_second
+        self.improvement = improvement
+        self._active = 0
+        self._cond = threading.Condition()
+        self._last_throughput = 0.0
+        self._since_decrease = self.limit
+        self._reset_window()
+
+    def _reset_window(self):
+        self._window_start = time.time()
+        self._window_bytes = 0
+        self._window_count = 0
+
+    def acquire(self):
+        """Block until fewer than limit downloads are running"""
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def _set_limit(self, limit: int, reason: str):
+        old = self.limit
+        self.limit = min(max(limit, self.minimum), self.maximum)
+        if self.limit != old:
+            logger.info(f"Download concurrency {old} -> {self.limit} ({reason})")
+            self._cond.notify_all()
+
+    def record(self, size_bytes: int, seconds: float, throttled: bool = False):
+        """Feed one finished download (size_bytes 0 for failures) into the controller"""
+        with self._cond:
+            self._since_decrease += 1
+            # Small files finish before TCP ramps up; only judge real transfers
+            slow = (size_bytes >= 1_000_000 and seconds > 0
+                    and size_bytes / seconds < self.slow_bytes_per_second)
+            if throttled or slow:
+                # Downloads started before the last cut report the same
+                # problem; wait for a window at the new limit before cutting again
+                if self._since_decrease >= self.limit:
+                    reason = "throttled" if throttled else f"slow transfer {size_bytes / seconds / 1e3:.0f} KB/s"
+                    self._set_limit(int(self.limit * self.decrease_factor), reason)
+                    self._since_decrease = 0
+                    # Measure the new limit from scratch
+                    self._last_throughput = 0.0
+                    self._reset_window()
+                return
+
+            self._window_bytes += size_bytes
+            self._window_count += 1
+            if self._window_count < self.limit:
+                return
+
+            elapsed = time.time() - self._window_start
+            throughput = self._window_bytes / elapsed if elapsed > 0 else 0.0
+            if throughput > self._last_throughput * (1 + self.improvement):
+                self._set_limit(self.limit + 1, f"throughput {throughput / 1e6:.1f} MB/s")
+            self._last_throughput = throughput
+            self._reset_window()
 
 
 class AudioDownloader:
     """Handles parallel audio downloads from YouTube"""
 
-    def __init__(self, output_dir: str = "temp_audio", channel_name: str = None, max_workers: int = 10):
+    def __init__(self, output_dir: str = "temp_audio", channel_name: str = None, max_workers: int = 10,
+                 disk_budget_bytes: int = 0, min_free_bytes: int = 0, max_concurrency: int = 0,
+                 retry_attempts: int = 0, retry_schedule_seconds: tuple = (),
+                 audio_format: str = 'speech', allow_video_fallback: bool = False,
+                 min_duration: float = 0, max_duration: float = 0):
         self.base_dir = Path(output_dir)
 
         # Create channel-specific subdirectory
         if channel_name:
-            # Sanitize channel name for folder
-            safe_channel = "".join(c for c in channel_name if c.isalnum() or c in (' ', '-', '_')).strip()
-            safe_channel = safe_channel[:100]  # Limit length
-            self.output_dir = self.base_dir / safe_channel
+            self.output_dir = self.base_dir / safe_filename(channel_name)
         else:
             self.output_dir = self.base_dir
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.max_workers = max_workers
+        self.disk_budget = DiskBudget(self.output_dir, disk_budget_bytes, min_free_bytes)
+
+        # With a ceiling above max_workers, concurrency starts at max_workers
+        # and adapts to measured throughput; enough threads are started for
+        # the ceiling and the controller decides how many download at once.
+        self.concurrency = None
+        if max_concurrency > max_workers:
+            self.concurrency = AdaptiveConcurrency(initial=max_workers, maximum=max_concurrency)
+        self.thread_count = max(max_workers, max_concurrency)
+        self.retry_attempts = retry_attempts
+        # Waits before later runs retry a video that failed in this one
+        self.retry_schedule_seconds = tuple(retry_schedule_seconds)
+        self.format_selector = audio_format_selector(audio_format, allow_video_fallback)
+        self.format_sort = audio_format_sort(audio_format)
+        # Seconds; checked against the real duration before anything is downloaded
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+
+        # Configured YoutubeDL instances, checked out for one download at a
+        # time. Each worker thread reuses an instance (extractor setup, HTTP
+        # keep-alive connections, cookies) instead of building one per video.
+        self._idle_ydls = queue.LifoQueue()
+        self._all_ydls = []
+        self._ydl_lock = threading.Lock()
 
         logger.info(f"Audio download directory: {self.output_dir}")
+        if self.disk_budget.enabled:
+            logger.info(f"Disk budget: {disk_budget_bytes / 1e9:.1f} GB pending audio, "
+                        f"{min_free_bytes / 1e9:.1f} GB free-space floor")
+        if self.concurrency:
+            logger.info(f"Adaptive download concurrency: {max_workers} to {max_concurrency}")
+
+    def _ydl_options(self) -> dict:
+        options = {
+            'format': self.format_selector,
+            'outtmpl': str(self.output_dir / "%(id)s.%(ext)s"),
+            'quiet': True,
+            'no_warnings': True,
+            'noprogress': True,  # Progress bars from parallel workers just interleave
+        }
+        if self.format_sort:
+            options['format_sort'] = self.format_sort
+        # Videos scraped without a duration reach the downloader unfiltered;
+        # yt-dlp knows the duration once it has extracted the video, so it can
+        # reject them there (=? lets videos without a duration through)
+        conditions = []
+        if self.min_duration:
+            conditions.append(f'duration >=? {self.min_duration:g}')
+        if self.max_duration:
+            conditions.append(f'duration <=? {self.max_duration:g}')
+        if conditions:
+            options['match_filter'] = yt_dlp.utils.match_filter_func(' & '.join(conditions))
+        return options
+
+    def _checkout_ydl(self):
+        """Take an idle YoutubeDL, or build one when all are busy"""
+        try:
+            return self._idle_ydls.get_nowait()
+        except queue.Empty:
+            ydl = yt_dlp.YoutubeDL(self._ydl_options())
+            with self._ydl_lock:
+                self._all_ydls.append(ydl)
+            return ydl
+
+    def _checkin_ydl(self, ydl):
+        self._idle_ydls.put(ydl)
+
+    def close(self):
+        """Close pooled YoutubeDL instances (saves cookies, drops connections)"""
+        with self._ydl_lock:
+            ydls, self._all_ydls = self._all_ydls, []
+        self._idle_ydls = queue.LifoQueue()
+        for ydl in ydls:
+            try:
+                ydl.close()
+            except Exception as e:
+                logger.debug(f"Error closing YoutubeDL: {e}")
 
     def download_single(self, video: dict, tracker: ProgressTracker) -> Optional[str]:
         """
         Download audio for a single video
-        Returns path to downloaded audio file or None on error
+        Network errors and throttling are retried up to retry_attempts times
+        with exponential backoff. While backing off, the adaptive-concurrency
+        slot and the disk budget reservation are given up (the worker thread
+        itself just sleeps, so other queued videos don't take its place);
+        permanent failures (private, removed, geo-blocked, age-restricted)
+        are marked 'error' on the first attempt. Premieres and live events
+        that haven't started yet fail at once too, but are scheduled for a
+        later run. Videos outside the duration range are marked 'skipped'
+        without being downloaded.
+        Returns path to downloaded audio file or None on error or skip
         """
         video_id = video['video_id']
-        url = video['url']
 
+        reserved = self.disk_budget.acquire(video)
         try:
             tracker.update_status(video_id, 'downloading')
             logger.info(f"Downloading: {video['title'][:50]}...")
 
-            output_template = str(self.output_dir / f"{video_id}.%(ext)s")
-
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'outtmpl': output_template,
-                'quiet': True,
-                'no_warnings': True,
-            }
-
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                ext = info.get('ext', 'webm')
-                audio_path = str(self.output_dir / f"{video_id}.{ext}")
-
-                if os.path.exists(audio_path):
-                    tracker.update_status(video_id, 'downloaded', audio_path=audio_path)
-                    logger.info(f"Downloaded: {video_id}")
+            attempt = 0
+            while True:
+                try:
+                    audio_path = self._download_attempt(video, tracker)
+                    if audio_path:
+                        self.disk_budget.add_file(audio_path)
                     return audio_path
-                else:
-                    logger.error(f"Audio file not found after download: {video_id}")
-                    tracker.update_status(video_id, 'error', error_message="Audio file not found after download")
-                    return None
+                except Exception as e:
+                    error_class = classify_download_error(e)
+                    attempt += 1
+                    retryable = error_class in RETRYABLE_ERROR_CLASSES
+                    if not retryable or attempt > self.retry_attempts:
+                        logger.error(f"Error downloading {video_id} ({error_class}): {e}")
+                        if retryable:
+                            retry_delays = self.retry_schedule_seconds
+                        elif error_class == 'upcoming':
+                            retry_delays = UPCOMING_RETRY_DELAYS
+                        else:
+                            retry_delays = ()
+                        next_retry_at = tracker.record_download_error(
+                            video_id, str(e), error_class, retry_delays=retry_delays
+                        )
+                        if next_retry_at:
+                            logger.info(f"Will retry {video_id} after "
+                                        f"{datetime.fromtimestamp(next_retry_at):%Y-%m-%d %H:%M}")
+                        return None
+                    delay = retry_delay(error_class, attempt)
+                    logger.warning(f"Download of {video_id} failed ({error_class}), "
+                                   f"retry {attempt}/{self.retry_attempts} in {delay:.0f}s: {e}")
+                    self.disk_budget.release(reserved)
+                    reserved = None
+                    time.sleep(delay)
+                    reserved = self.disk_budget.acquire(video)
+        finally:
+            if reserved is not None:
+                self.disk_budget.release(reserved)
+
+    def _download_attempt(self, video: dict, tracker: ProgressTracker) -> Optional[str]:
+        """
+        One download try; raises on failure so download_single can classify it
+        Returns None when the match filter turned the video away for its duration.
+        """
+        video_id = video['video_id']
 
+        if self.concurrency:
+            self.concurrency.acquire()
+        start_time = time.time()
+        try:
+            # Output template is "<video id>.<ext>", so pooled instances work for any video
+            ydl = self._checkout_ydl()
+            try:
+                info = ydl.extract_info(video['url'], download=True)
+            finally:
+                self._checkin_ydl(ydl)
         except Exception as e:
-            logger.error(f"Error downloading {video_id}: {e}")
-            tracker.update_status(video_id, 'error', error_message=str(e))
+            if self.concurrency:
+                self.concurrency.record(0, time.time() - start_time,
+                                        throttled=classify_download_error(e) == 'throttling')
+            tracker.record_metric(video_id, 'download', time.time() - start_time, success=False,
+                                  concurrency=self.current_concurrency)
+            raise
+        finally:
+            if self.concurrency:
+                self.concurrency.release()
+
+        duration = info.get('duration')
+        if duration and not tracker.in_duration_range(duration):
+            # Rejected by the match filter - yt-dlp returns the info but downloads nothing
+            tracker.update_status(video_id, 'skipped', error_message=DURATION_SKIP_REASON,
+                                  duration=int(duration))
+            logger.info(f"Skipped {video_id}: {duration / 60:.1f} min is outside the duration range")
             return None
 
+        ext = info.get('ext', 'webm')
+        audio_path = str(self.output_dir / f"{video_id}.{ext}")
+
+        if not os.path.exists(audio_path):
+            # yt-dlp reported success but left no file (e.g. an interrupted
+            # rename); fail like any other attempt so it is classified and retried
+            tracker.record_metric(video_id, 'download', time.time() - start_time, success=False,
+                                  concurrency=self.current_concurrency)
+            raise FileNotFoundError(f"Audio file not found after download: {audio_path}")
+
+        seconds = time.time() - start_time
+        size_bytes = os.path.getsize(audio_path)
+        if self.concurrency:
+            self.concurrency.record(size_bytes, seconds)
+        tracker.record_metric(video_id, 'download', seconds, size_bytes=size_bytes,
+                              audio_seconds=info.get('duration'),
+                              concurrency=self.current_concurrency)
+        extra = {}
+        if not video.get('duration') and info.get('duration'):
+            # Flat scrapes often lack durations; the download knows it
+            extra['duration'] = int(info['duration'])
+        audio_format = ' '.join(
+            str(part) for part in (info.get('format_id'), info.get('acodec'),
+                                   f"{info['abr']:.0f}k" if info.get('abr') else None)
+            if part
+        )
+        bytes_saved = format_bytes_saved(info, size_bytes)
+        # A success ends any cross-run retry streak
+        tracker.update_status(video_id, 'downloaded', audio_path=audio_path, error_class=None,
+                              download_attempts=0, next_retry_at=None,
+                              audio_format=audio_format or None, bytes_saved=bytes_saved, **extra)
+        logger.info(f"Downloaded: {video_id} ({audio_format or 'unknown format'}, {size_bytes / 1e6:.1f} MB"
+                    + (f", {bytes_saved / 1e6:.1f} MB saved)" if bytes_saved else ")"))
+        return audio_path
+
+    @property
+    def current_concurrency(self) -> int:
+        """Downloads allowed to run at once right now"""
+        return self.concurrency.limit if self.concurrency else self.max_workers
+
     def download_batch(self, videos: List[dict], tracker: ProgressTracker) -> List[str]:
         """
         Download multiple videos in parallel
         Returns list of successfully downloaded audio paths
         """
-        logger.info(f"Starting parallel download of {len(videos)} videos with {self.max_workers} workers")
+        logger.info(f"Starting parallel download of {len(videos)} videos with {self.current_concurrency} workers")
 
         audio_paths = []
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with ThreadPoolExecutor(max_workers=self.thread_count) as executor:
             futures = {
                 executor.submit(self.download_single, video, tracker): video
                 for video in videos
@@ -334,28 +2029,296 @@ class AudioDownloader:
                 if audio_path:
                     audio_paths.append(audio_path)
 
-        logger.info(f"Downloaded {len(audio_paths)}/{len(videos)} videos successfully")
+        logger.info(f"Downloaded {len(audio_paths)}/{len(videos)} videos successfully"
+                    + (f" (concurrency now {self.current_concurrency})" if self.concurrency else ""))
         return audio_paths
 
 
+# Whisper's input format: 16 kHz mono
+SAMPLE_RATE = 16000
+
+
+# Suffix of .npy files still being written (renamed into place when complete)
+TMP_NPY_SUFFIX = '.tmp.npy'
+
+
+def _save_npy(path: str, samples: np.ndarray):
+    """Write a .npy atomically (readers never see a partial file)"""
+    tmp_path = path[:-len('.npy')] + TMP_NPY_SUFFIX
+    np.save(tmp_path, samples)
+    os.replace(tmp_path, path)
+
+
+def _decode_to_pcm(audio_path: str, pcm_path: Optional[str], dtype: str, cache_path: Optional[str] = None):
+    """
+    Decode-ahead process pool task
+    Returns (pcm, audio_seconds, decode_seconds, cached_bytes); pcm is the
+    array, or pcm_path after saving it there as .npy. With cache_path the
+    int16 samples are also written there (cached_bytes is its size, else 0),
+    so no file I/O is left for the transcription thread.
+    """
+    start = time.time()
+    audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+    if len(audio) == 0:
+        raise ValueError("No audio decoded")
+    if dtype == 'int16':
+        audio = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+
+    cached_bytes = 0
+    if cache_path:
+        cached = audio if audio.dtype == np.int16 else (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+        try:
+            _save_npy(cache_path, cached)
+            cached_bytes = os.path.getsize(cache_path)
+        except OSError:
+            cache_path = None  # e.g. cache disk full; the decode itself still succeeded
+
+    pcm = audio
+    if pcm_path:
+        if cache_path and audio.dtype == np.int16:
+            # Same bytes as the cache entry; share them instead of writing twice
+            try:
+                os.link(cache_path, pcm_path)
+            except FileExistsError:
+                pass
+            except OSError:
+                shutil.copyfile(cache_path, pcm_path)
+        else:
+            _save_npy(pcm_path, audio)
+        pcm = pcm_path
+    return pcm, len(audio) / SAMPLE_RATE, time.time() - start, cached_bytes
+
+
+def load_pcm(pcm) -> np.ndarray:
+    """float32 samples for WhisperModel.transcribe from an array or a .npy path (memory-mapped)"""
+    if isinstance(pcm, (str, Path)):
+        pcm = np.load(pcm, mmap_mode='r')
+    if pcm.dtype == np.int16:
+        return pcm.astype(np.float32) / 32768.0
+    return np.asarray(pcm, dtype=np.float32)
+
+
+class PCMCache:
+    """
+    Decoded audio kept across runs for re-transcription
+    One int16 16 kHz <video_id>.npy per video, ~115 MB per hour of audio:
+    more than the downloaded opus stream (~22-72 MB per hour), spent to
+    skip both download and decode. Hits are memory-mapped, so re-running a
+    channel with a bigger model starts transcribing at once. Decode workers
+    write the entries; this class keeps the index and evicts the least
+    recently used files to stay under max_bytes (file mtimes carry the LRU
+    order across runs).
+    """
+
+    def __init__(self, cache_dir: str = "data/pcm_cache", max_bytes: int = 0):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        entries = []
+        with os.scandir(self.cache_dir) as scan:
+            for entry in scan:
+                if not entry.is_file() or not entry.name.endswith('.npy'):
+                    continue
+                stat = entry.stat()
+                if entry.name.endswith(TMP_NPY_SUFFIX):
+                    # Left by a decode that was killed mid-write; a day's grace
+                    # in case another run is writing into the same directory
+                    if time.time() - stat.st_mtime > 86400:
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+                    continue
+                entries.append((stat.st_mtime, entry.name[:-len('.npy')], stat.st_size))
+        entries.sort()
+        # video_id -> bytes, least recently used first
+        self._entries = OrderedDict((video_id, size) for _, video_id, size in entries)
+        self.used_bytes = sum(self._entries.values())
+        logger.info(f"PCM cache: {len(self._entries)} videos, {self.used_bytes / 1e9:.1f} of "
+                    f"{max_bytes / 1e9:.1f} GB ({self.cache_dir})")
+
+    def _path(self, video_id: str) -> Path:
+        return self.cache_dir / f"{video_id}.npy"
+
+    def path_for(self, video_id: str) -> str:
+        """Where a decode worker should write a video's entry before add()"""
+        return str(self._path(video_id))
+
+    def __contains__(self, video_id: str) -> bool:
+        with self._lock:
+            return video_id in self._entries
+
+    def _touch(self, video_id: str) -> bool:
+        """Mark a hit as most recently used; False if the file has gone"""
+        with self._lock:
+            if video_id not in self._entries:
+                return False
+            try:
+                os.utime(self._path(video_id))
+            except FileNotFoundError:
+                self.used_bytes -= self._entries.pop(video_id)
+                return False
+            self._entries.move_to_end(video_id)
+            return True
+
+    def load(self, video_id: str) -> Optional[np.ndarray]:
+        """Memory-mapped int16 samples, or None on a miss"""
+        if not self._touch(video_id):
+            return None
+        return np.load(self._path(video_id), mmap_mode='r')
+
+    def link(self, video_id: str, dest_path: str) -> Optional[str]:
+        """
+        Expose a cached file at dest_path (hard link, else copy) for a consumer
+        that deletes it when done; returns dest_path or None on a miss
+        """
+        if not self._touch(video_id):
+            return None
+        try:
+            os.link(self._path(video_id), dest_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copyfile(self._path(video_id), dest_path)
+        return dest_path
+
+    def add(self, video_id: str, size: int):
+        """Index an entry a decode worker wrote at path_for(video_id), evicting old entries over the quota"""
+        if size > self.max_bytes:
+            try:
+                os.remove(self._path(video_id))
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self.used_bytes += size - self._entries.pop(video_id, 0)
+            self._entries[video_id] = size
+        self._evict()
+
+    def _evict(self):
+        """
+        Remove least recently used files until under max_bytes
+        A file that can't be removed yet (memory-mapped or open, which
+        Windows refuses) keeps its entry, so its bytes stay counted and it
+        is tried again on the next add(); newer files are evicted meanwhile.
+        """
+        with self._lock:
+            over = self.used_bytes - self.max_bytes
+            # Never evict the newest entry, even when it alone exceeds the quota
+            candidates = list(self._entries.items())[:-1]
+
+        evicted = 0
+        for video_id, size in candidates:
+            if over <= 0:
+                break
+            try:
+                os.remove(self._path(video_id))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Could not evict {video_id} from PCM cache yet: {e}")
+                continue
+            with self._lock:
+                if self._entries.get(video_id) == size:
+                    del self._entries[video_id]
+                    self.used_bytes -= size
+            over -= size
+            evicted += 1
+        if evicted:
+            logger.debug(f"PCM cache evicted {evicted} videos")
+
+
+class AudioDecoder:
+    """
+    Decodes downloaded audio to 16 kHz mono PCM in a CPU process pool
+    The next `lookahead` files in the transcription queue are decoded ahead,
+    so by the time the transcriber reaches one its samples are ready and the
+    GPU never waits on ffmpeg. The window is kept small because decoded PCM
+    (~115 MB per hour of int16 audio) sits in memory or on disk outside the
+    download disk budget until it is transcribed. Corrupt or empty files fail here, before a model sees them.
+    PCM is returned in memory, or written next to the audio as
+    <video_id>.pcm.npy (to_disk) for transcription worker processes to
+    memory-map. int16 halves the size of float32.
+    """
+
+    def __init__(self, max_workers: int = 2, dtype: str = 'int16', to_disk: bool = False,
+                 cache: PCMCache = None):
+        if dtype not in ('int16', 'float32'):
+            raise ValueError(f"Unknown PCM dtype: {dtype} (choose from int16, float32)")
+        self.max_workers = max_workers
+        self.dtype = dtype
+        self.to_disk = to_disk
+        self.cache = cache  # Every successful decode is also stored here
+        # The file being transcribed plus one decoding per worker
+        self.lookahead = max_workers + 1
+        # ffmpeg (PyAV) decoding holds the GIL for long stretches; processes scale
+        self._executor = ProcessPoolExecutor(max_workers=max_workers,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        logger.info(f"Decoding ahead with {max_workers} processes "
+                    f"({dtype} PCM{', memory-mapped .npy' if to_disk else ''})")
+
+    @staticmethod
+    def pcm_path_for(audio_path: str) -> str:
+        audio_path = Path(audio_path)
+        return str(audio_path.with_name(f"{audio_path.stem}.pcm.npy"))
+
+    def submit(self, video_id: str, audio_path: str):
+        """Start decoding a file; returns a Future for collect()"""
+        pcm_path = self.pcm_path_for(audio_path) if self.to_disk else None
+        cache_path = self.cache.path_for(video_id) if self.cache else None
+        return self._executor.submit(_decode_to_pcm, audio_path, pcm_path, self.dtype, cache_path)
+
+    def collect(self, video_id: str, audio_path: str, future, tracker: ProgressTracker):
+        """
+        Wait for a decode and record it
+        Returns the PCM (array or .npy path), or None after marking the
+        video 'error' and removing the unusable audio file.
+        """
+        start_time = time.time()
+        try:
+            pcm, audio_seconds, decode_seconds, cached_bytes = future.result()
+        except Exception as e:
+            logger.error(f"Error decoding {video_id}: {e}")
+            tracker.record_metric(video_id, 'decode', time.time() - start_time, success=False)
+            tracker.update_status(video_id, 'error', error_message=f"Decode failed: {e}", error_class='decode')
+            try:
+                os.remove(audio_path)
+            except OSError:
+                pass
+            return None
+
+        tracker.record_metric(video_id, 'decode', decode_seconds, audio_seconds=audio_seconds)
+        if self.cache and cached_bytes:
+            self.cache.add(video_id, cached_bytes)
+        waited = time.time() - start_time
+        if waited > 1:
+            logger.info(f"Waited {waited:.1f}s for decode of {video_id} (raise DECODE_WORKERS if this keeps happening)")
+        return pcm
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 class GPUTranscriber:
     """GPU-accelerated Whisper transcription"""
 
-    def __init__(self, model_size: str = "base", output_dir: str = "transcripts", channel_name: str = None, device: str = "cuda"):
+    def __init__(self, model_size: str = "base", output_dir: str = "transcripts", channel_name: str = None, device: str = "cuda",
+                 device_index: int = 0, cpu_threads: int = 0):
         self.model_size = model_size
         self.base_dir = Path(output_dir)
 
         # Create channel-specific subdirectory
         if channel_name:
-            # Sanitize channel name for folder
-            safe_channel = "".join(c for c in channel_name if c.isalnum() or c in (' ', '-', '_')).strip()
-            safe_channel = safe_channel[:100]  # Limit length
-            self.output_dir = self.base_dir / safe_channel
+            self.output_dir = self.base_dir / safe_filename(channel_name)
         else:
             self.output_dir = self.base_dir
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.device = device
+        self.device_index = device_index
+        self.cpu_threads = cpu_threads  # 0 = let CTranslate2 decide
         self.model = None
 
         logger.info(f"Initializing GPU Transcriber with model: {model_size}")
@@ -366,15 +2329,16 @@ class GPUTranscriber:
         """Load Whisper model using faster-whisper"""
         try:
             import torch
-            if torch.cuda.is_available():
-                logger.info(f"CUDA available: {torch.cuda.get_device_name(0)}")
-                logger.info(f"CUDA memory: {torch.cuda.get_device_properties(0).total_memory / 1e9:.2f} GB")
+            if self.device != "cpu" and torch.cuda.is_available():
+                logger.info(f"CUDA available: {torch.cuda.get_device_name(self.device_index)} (device {self.device_index})")
+                logger.info(f"CUDA memory: {torch.cuda.get_device_properties(self.device_index).total_memory / 1e9:.2f} GB")
 
                 # Try GPU first, fall back to CPU if CUDA 12 libraries missing
                 try:
                     self.model = WhisperModel(
                         self.model_size,
                         device="cuda",
+                        device_index=self.device_index,
                         compute_type="float16",
                         num_workers=4
                     )
@@ -389,18 +2353,21 @@ class GPUTranscriber:
                             self.model_size,
                             device="cpu",
                             compute_type="int8",
+                            cpu_threads=self.cpu_threads,
                             num_workers=4
                         )
                         logger.info(f"Model loaded on CPU with int8 optimization")
                     else:
                         raise
             else:
-                logger.warning("CUDA not available, using CPU mode")
+                if self.device != "cpu":
+                    logger.warning("CUDA not available, using CPU mode")
                 self.device = "cpu"
                 self.model = WhisperModel(
                     self.model_size,
                     device="cpu",
                     compute_type="int8",
+                    cpu_threads=self.cpu_threads,
                     num_workers=4
                 )
                 logger.info(f"Model loaded on CPU with int8 optimization")
@@ -408,28 +2375,45 @@ class GPUTranscriber:
             logger.error(f"Error loading model: {e}")
             logger.warning("Falling back to basic CPU mode")
             self.device = "cpu"
-            self.model = WhisperModel(self.model_size, device="cpu", compute_type="int8")
+            self.model = WhisperModel(self.model_size, device="cpu", compute_type="int8", cpu_threads=self.cpu_threads)
 
-    def transcribe_single(self, video_id: str, audio_path: str, tracker: ProgressTracker) -> Optional[str]:
+    def transcribe_single(self, video_id: str, audio_path: str, tracker: ProgressTracker,
+                          pcm=None) -> Optional[str]:
         """
         Transcribe a single audio file
+        pcm is the file already decoded by AudioDecoder (an array or a .npy
+        path); without it the file is decoded here. audio_path is None when
+        the PCM came from the PCMCache.
         Returns path to transcript file or None on error
         """
+        start_time = time.time()
         try:
             tracker.update_status(video_id, 'transcribing')
             logger.info(f"Transcribing: {video_id}")
 
             # Get video info for title
             cursor = tracker.conn.cursor()
-            cursor.execute('SELECT title FROM videos WHERE video_id = ?', (video_id,))
+            cursor.execute('SELECT title, duration FROM videos WHERE video_id = ?', (video_id,))
             result = cursor.fetchone()
             title = result[0] if result else video_id
+            known_duration = result[1] if result else 0
 
-            start_time = time.time()
+            if pcm is not None:
+                # Decoded ahead by AudioDecoder, which recorded the decode metric
+                audio = load_pcm(pcm)
+                decode_seconds = time.time() - start_time
+            else:
+                # Decode to 16 kHz mono up front so decode and GPU time are
+                # recorded separately (faster-whisper would do the same internally)
+                audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+                decode_seconds = time.time() - start_time
+                audio_seconds = len(audio) / SAMPLE_RATE
+                tracker.record_metric(video_id, 'decode', decode_seconds, audio_seconds=audio_seconds)
 
             # Transcribe with GPU using faster-whisper
+            transcribe_start = time.time()
             segments, info = self.model.transcribe(
-                audio_path,
+                audio,
                 language="en",  # Change to None for auto-detect
                 task="transcribe",
                 vad_filter=True,  # Voice Activity Detection - skip silence
@@ -446,37 +2430,56 @@ class GPUTranscriber:
                 'duration': info.duration
             }
 
+            transcribe_seconds = time.time() - transcribe_start
+            tracker.record_metric(video_id, 'transcribe', transcribe_seconds, audio_seconds=info.duration)
             elapsed = time.time() - start_time
 
             # Format transcript
             transcript = self._format_transcript(result, title, video_id)
 
             # Save transcript
-            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
-            safe_title = safe_title[:80]
-            transcript_filename = f"{safe_title}_{video_id}.txt"
+            transcript_filename = f"{safe_filename(title, 80)}_{video_id}.txt"
             transcript_path = self.output_dir / transcript_filename
 
             with open(transcript_path, 'w', encoding='utf-8') as f:
                 f.write(transcript)
 
-            logger.info(f"Transcribed {video_id} in {elapsed:.1f}s → {transcript_path.name}")
+            logger.info(f"Transcribed {video_id} in {elapsed:.1f}s "
+                        f"(decode {decode_seconds:.1f}s, {info.duration / max(transcribe_seconds, 1e-6):.0f}x realtime) "
+                        f"→ {transcript_path.name}")
 
             # Update database
-            tracker.update_status(video_id, 'completed', transcript_path=str(transcript_path))
+            extra = {} if known_duration else {'duration': int(info.duration)}
+            tracker.update_status(video_id, 'completed', transcript_path=str(transcript_path), **extra)
 
             # Cleanup audio file to save space
-            try:
-                os.remove(audio_path)
-                logger.info(f"Cleaned up audio: {audio_path}")
-            except Exception as e:
-                logger.warning(f"Could not remove audio file: {e}")
+            if audio_path:
+                try:
+                    os.remove(audio_path)
+                    logger.info(f"Cleaned up audio: {audio_path}")
+                except Exception as e:
+                    logger.warning(f"Could not remove audio file: {e}")
+            if isinstance(pcm, str):
+                del audio
+                try:
+                    os.remove(pcm)
+                except OSError as e:
+                    logger.warning(f"Could not remove decoded audio: {e}")
 
             return str(transcript_path)
 
         except Exception as e:
             logger.error(f"Error transcribing {video_id}: {e}")
+            tracker.record_metric(video_id, 'transcribe', time.time() - start_time, success=False)
             tracker.update_status(video_id, 'error', error_message=str(e))
+            # Don't leave files behind that no later step will clean up; a
+            # retry downloads the audio again
+            for path in (audio_path, pcm if isinstance(pcm, str) else None):
+                if path:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
             return None
 
     def _format_transcript(self, result: dict, title: str, video_id: str) -> str:
@@ -534,6 +2537,359 @@ class GPUTranscriber:
             return f"{minutes:02d}:{secs:02d}"
 
 
+@dataclass
+class DeviceSlot:
+    """A transcription worker's share of the hardware"""
+    device: str  # "cuda" or "cpu"
+    device_index: int = 0
+    cpu_threads: int = 0
+
+    @property
+    def key(self) -> str:
+        """Identifies the physical device; slots with the same key share a work queue"""
+        if self.device == "cuda":
+            return f"cuda:{self.device_index}"
+        return "cpu"
+
+    @property
+    def name(self) -> str:
+        if self.device == "cuda":
+            return self.key
+        return f"cpu({self.cpu_threads} threads)"
+
+
+# Approximate VRAM used by one faster-whisper model at float16, in GB
+# (weights plus decoding buffers); used to fit several models on one GPU
+MODEL_VRAM_GB = {
+    'tiny': 1.0,
+    'base': 1.0,
+    'small': 2.0,
+    'medium': 3.5,
+    'large': 5.0,
+}
+
+
+def visible_gpus() -> List[float]:
+    """Total memory (GB) of each CUDA device visible to this process, by index"""
+    try:
+        import torch
+        if not torch.cuda.is_available():
+            return []
+        return [torch.cuda.get_device_properties(i).total_memory / 1e9
+                for i in range(torch.cuda.device_count())]
+    except Exception:
+        return []
+
+
+def plan_device_slots(num_workers: int, device: str = "cuda", model_size: str = "base",
+                      models_per_gpu: int = 1, gpu_memory_gb: List[float] = None,
+                      cpu_count: int = None) -> List[DeviceSlot]:
+    """
+    Assign each transcription worker a GPU index or a slice of CPU threads
+
+    Args:
+        num_workers: Number of workers, or 0 to use every slot the hardware allows
+        device: "cuda" to use visible GPUs (falls back to CPU if none), "cpu" to force CPU
+        model_size: Whisper model size, used to estimate how many models fit in VRAM
+        models_per_gpu: Models loaded per GPU, or 0 to fit as many as VRAM allows
+        gpu_memory_gb: Memory of each GPU; detected with torch when None
+        cpu_count: CPU cores to split between CPU workers; os.cpu_count() when None
+
+    GPU slots are interleaved across devices (0, 1, 0, 1, ...) so any prefix
+    of the plan spreads load evenly. CPU workers split the cores evenly so
+    they don't oversubscribe each other.
+    """
+    if gpu_memory_gb is None:
+        gpu_memory_gb = visible_gpus() if device != "cpu" else []
+
+    if gpu_memory_gb:
+        capacity = []
+        for memory in gpu_memory_gb:
+            if models_per_gpu > 0:
+                capacity.append(models_per_gpu)
+            else:
+                # Leave ~10% headroom for the CUDA context and fragmentation
+                per_model = MODEL_VRAM_GB.get(model_size.split('.')[0].split('-')[0], MODEL_VRAM_GB['large'])
+                capacity.append(max(1, int(memory * 0.9 // per_model)))
+
+        slots = []
+        for round_index in range(max(capacity)):
+            for index, cap in enumerate(capacity):
+                if round_index < cap:
+                    slots.append(DeviceSlot("cuda", device_index=index))
+
+        if num_workers <= 0:
+            return slots
+        if num_workers > len(slots):
+            logger.warning(f"{num_workers} transcription workers requested but only {len(slots)} "
+                           f"model slots fit on {len(gpu_memory_gb)} GPU(s); sharing devices")
+        return [slots[i % len(slots)] for i in range(num_workers)]
+
+    cpu_count = cpu_count or os.cpu_count() or 1
+    if num_workers <= 0:
+        # CTranslate2 int8 decoding stops scaling well beyond a few threads per model
+        num_workers = max(1, cpu_count // 4)
+    threads = max(1, cpu_count // num_workers)
+    return [DeviceSlot("cpu", cpu_threads=threads) for _ in range(num_workers)]
+
+
+class DeviceScheduler:
+    """
+    Assigns files to devices by least outstanding audio per model slot
+    Pure bookkeeping (no CUDA calls) so it works with any set of DeviceSlots.
+    """
+
+    def __init__(self, slots: List[DeviceSlot]):
+        self.capacity = {}
+        for slot in slots:
+            self.capacity[slot.key] = self.capacity.get(slot.key, 0) + 1
+        self.load = {key: 0.0 for key in self.capacity}
+        self._assigned = {}
+
+    def assign(self, video_id: str, duration: float = 0) -> str:
+        """Pick the device for a file and record its load; returns the device key"""
+        weight = max(float(duration or 0), 1.0)  # Unknown durations still count
+        key = min(self.load, key=lambda k: self.load[k] / self.capacity[k])
+        self.load[key] += weight
+        self._assigned[video_id] = (key, weight)
+        return key
+
+    def complete(self, video_id: str):
+        """Release a finished file's load from its device"""
+        key, weight = self._assigned.pop(video_id, (None, 0))
+        if key is not None and key in self.load:
+            self.load[key] = max(0.0, self.load[key] - weight)
+
+    def remove_slot(self, key: str):
+        """Drop one model slot from a device; the device stops receiving files once it has none"""
+        self.capacity[key] -= 1
+        if self.capacity[key] <= 0:
+            del self.capacity[key]
+            del self.load[key]
+
+
+def _transcription_worker(slot: DeviceSlot, model_size: str, output_dir: str, db_path: str,
+                          tasks, results, worker_index: int = 0):
+    """
+    Worker process entry point
+    Owns its own WhisperModel and database connection, pulls (video_id,
+    audio_path, pcm_path) tasks until it receives None. Announces each file
+    before starting it so the parent knows what was lost if the process dies.
+    """
+    tracker = ProgressTracker(db_path=db_path)
+    try:
+        transcriber = GPUTranscriber(
+            model_size=model_size,
+            output_dir=output_dir,
+            device=slot.device,
+            device_index=slot.device_index,
+            cpu_threads=slot.cpu_threads
+        )
+        results.put(('ready', slot.name, transcriber.device))
+
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            video_id, audio_path, pcm_path = task
+            results.put(('start', video_id, worker_index))
+            transcript_path = transcriber.transcribe_single(video_id, audio_path, tracker, pcm=pcm_path)
+            results.put(('done', video_id, transcript_path))
+    finally:
+        tracker.release_leases()
+        tracker.close()
+
+
+class TranscriptionPool:
+    """
+    Multi-process transcription engine
+    Each worker process loads its own Whisper model pinned to a DeviceSlot,
+    so several GPUs (or CPU core slices) transcribe in parallel.
+    """
+
+    def __init__(self, model_size: str, output_dir: str, db_path: str, slots: List[DeviceSlot],
+                 channel_name: str = None, on_result=None):
+        self.model_size = model_size
+        self.db_path = db_path
+        self.slots = slots
+        self.on_result = on_result  # called as on_result(video_id, transcript_path)
+
+        self.output_dir = Path(output_dir)
+        if channel_name:
+            self.output_dir = self.output_dir / safe_filename(channel_name)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # CUDA can't be initialised in a forked child, always spawn
+        self._ctx = multiprocessing.get_context("spawn")
+        self._scheduler = DeviceScheduler(slots)
+        # One queue per device, shared by that device's workers; each holds at
+        # most one file per worker so assignment stays close to real-time load
+        self._tasks = {
+            key: self._ctx.Queue(maxsize=capacity)
+            for key, capacity in self._scheduler.capacity.items()
+        }
+        self._results = self._ctx.Queue()
+        self._processes = []
+        self._collector = None
+        self._cond = threading.Condition()
+        self._pending = {}   # video_id -> device key, submitted but not reported back
+        self._running = {}   # worker index -> video_id it is transcribing
+        self._dead = set()   # worker indexes that have exited
+        self._closing = False
+        self.completed = 0
+        self.failed = 0
+
+    def start(self):
+        """Spawn worker processes"""
+        logger.info(f"Starting {len(self.slots)} transcription workers: "
+                    f"{', '.join(slot.name for slot in self.slots)}")
+        for i, slot in enumerate(self.slots):
+            process = self._ctx.Process(
+                target=_transcription_worker,
+                args=(slot, self.model_size, str(self.output_dir), self.db_path,
+                      self._tasks[slot.key], self._results, i),
+                name=f"transcriber-{i}",
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+
+        self._collector = threading.Thread(target=self._collect, name="transcription-results", daemon=True)
+        self._collector.start()
+        return self
+
+    def _collect(self):
+        """Drain worker results in the parent process"""
+        last_check = time.time()
+        while True:
+            try:
+                kind, key, value = self._results.get(timeout=1.0)
+            except queue.Empty:
+                if not self._check_workers():
+                    return
+                last_check = time.time()
+                continue
+
+            if kind == 'ready':
+                logger.info(f"Transcription worker ready on {key} (model running on {value})")
+            elif kind == 'start':
+                with self._cond:
+                    self._running[value] = key
+            else:
+                self._finish(key, value)
+
+            # A steady stream of results must not hide a worker that died
+            if time.time() - last_check > 5:
+                if not self._check_workers():
+                    return
+                last_check = time.time()
+
+    def _finish(self, video_id: str, transcript_path: Optional[str]):
+        """Record a file's outcome and release its device load"""
+        with self._cond:
+            if self._pending.pop(video_id, None) is None:
+                return  # Already written off when its worker died
+            for index, running_id in list(self._running.items()):
+                if running_id == video_id:
+                    del self._running[index]
+            self._scheduler.complete(video_id)
+            if transcript_path:
+                self.completed += 1
+            else:
+                self.failed += 1
+            self._cond.notify_all()
+        if self.on_result:
+            self.on_result(video_id, transcript_path)
+
+    def _check_workers(self) -> bool:
+        """
+        Write off work held by workers that exited
+        A dead worker loses the file it was transcribing (its lease lets the
+        next run reclaim it); when a device has no workers left, the files
+        queued for it are failed too and the device stops receiving work.
+        Returns False once every worker is gone.
+        """
+        lost = []
+        with self._cond:
+            for index, process in enumerate(self._processes):
+                if index in self._dead or process.is_alive():
+                    continue
+                self._dead.add(index)
+                slot = self.slots[index]
+                if not self._closing:
+                    logger.error(f"Transcription worker {process.name} on {slot.name} "
+                                 f"exited unexpectedly (exit code {process.exitcode})")
+                video_id = self._running.pop(index, None)
+                if video_id:
+                    lost.append(video_id)
+
+                self._scheduler.remove_slot(slot.key)
+                if slot.key not in self._scheduler.capacity:
+                    # Nobody reads this device's queue any more; empty it so submit() can't block on it
+                    while True:
+                        try:
+                            self._tasks[slot.key].get_nowait()
+                        except queue.Empty:
+                            break
+                    running = set(self._running.values())
+                    lost.extend(v for v, k in self._pending.items()
+                                if k == slot.key and v not in running and v not in lost)
+
+            all_dead = len(self._dead) == len(self._processes)
+            if all_dead:
+                lost.extend(v for v in self._pending if v not in lost)
+
+        if lost:
+            logger.error(f"Transcription workers exited with {len(lost)} files unfinished")
+        for video_id in lost:
+            self._finish(video_id, None)
+        return not all_dead
+
+    def submit(self, video_id: str, audio_path: str, duration: float = 0, pcm_path: str = None):
+        """Queue a file on the least-loaded device (blocks while that device is busy)"""
+        with self._cond:
+            if not self._scheduler.capacity:
+                logger.error(f"No transcription workers left, skipping {video_id}")
+                self.failed += 1
+                return
+            device_key = self._scheduler.assign(video_id, duration)
+            self._pending[video_id] = device_key
+        logger.debug(f"Assigned {video_id} to {device_key}")
+        while True:
+            try:
+                self._tasks[device_key].put((video_id, audio_path, pcm_path), timeout=1.0)
+                return
+            except queue.Full:
+                with self._cond:
+                    if video_id not in self._pending:
+                        return  # The device's workers died while we waited
+
+    def wait(self):
+        """Block until every submitted file has been transcribed"""
+        with self._cond:
+            while self._pending:
+                self._cond.wait(timeout=1.0)
+
+    def close(self):
+        """Wait for outstanding work, then stop the workers"""
+        self.wait()
+        self._closing = True
+        for index, slot in enumerate(self.slots):
+            if index not in self._dead:
+                self._tasks[slot.key].put(None)
+        for process in self._processes:
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+        logger.info(f"Transcription pool finished: {self.completed} completed, {self.failed} failed")
+
+
+# Streaming scrape inserts: videos per transaction, and the longest a found
+# video waits in the buffer (checked as each video arrives)
+SCRAPE_INSERT_BATCH = 50
+SCRAPE_INSERT_SECONDS = 1.0
+
+
 class ChannelTranscriptionOrchestrator:
     """Main orchestrator for the entire transcription pipeline"""
 
@@ -542,20 +2898,88 @@ class ChannelTranscriptionOrchestrator:
         channel_url: str,
         model_size: str = "base",
         download_workers: int = 10,
-        transcribe_workers: int = 1,  # GPU: usually 1-2 depending on VRAM
+        transcribe_workers: int = 1,  # 0 = one per model slot on all visible GPUs
         audio_base_dir: str = "data/temp_audio",
         transcript_base_dir: str = "data/transcripts",
         db_path: str = "data/transcription_progress.db",
+        batch_size: int = 20,
+        pipeline_mode: str = "streaming",  # "streaming" or "batch"
+        disk_budget_gb: float = 0,  # 0 = no limit (streaming mode only)
+        min_free_disk_gb: float = 0,
+        device: str = "cuda",
+        models_per_gpu: int = 1,  # 0 = as many as VRAM allows
+        scheduling_policy: str = "shortest_first",
+        realtime_factor: float = 35.0,  # Expected transcription speed, for estimates
+        db_synchronous: str = "FULL",
+        db_commit_interval: float = 0.0,  # Seconds; 0 = commit every status update
+        incremental_scrape: bool = False,
+        scrape_stop_after_known: int = 50,
+        full_resync_days: float = 0,  # Force a full scrape when the last one is older; 0 = never
+        full_resync: bool = False,  # Force a full scrape this run
+        streaming_scrape: bool = False,  # Start downloading before the scrape finishes (streaming mode)
+        scrape_tabs: tuple = ('videos',),  # Any of CHANNEL_TABS, scraped concurrently
+        scrape_cache_dir: str = "data/scrape_cache",
+        scrape_cache_ttl_hours: float = 0,  # Reuse channel listings this recent; 0 = no cache
+        min_duration_minutes: float = 0,  # Skip shorter videos; 0 = no limit
+        max_duration_minutes: float = 0,  # Skip longer videos; 0 = no limit
+        metadata_workers: int = 0,  # Concurrent duration lookups before scheduling; 0 = off
+        metadata_retry_days: float = 7,
+        max_download_workers: int = 0,  # Above download_workers: adapt concurrency up to this
+        download_retry_attempts: int = 3,  # Retries for network errors and throttling
+        download_retry_schedule_hours: tuple = (),  # Later runs retry failures after these waits
+        audio_format: str = 'speech',  # AUDIO_FORMAT_LADDERS name or a yt-dlp format selector
+        allow_video_fallback: bool = False,  # Download a video format when no audio-only one exists
+        decode_workers: int = 0,  # Processes decoding audio ahead of transcription; 0 = decode in the transcriber
+        decode_dtype: str = 'int16',  # PCM sample format handed to the transcriber ('int16' or 'float32')
+        decode_to_disk: bool = False,  # Pass decoded audio as memory-mapped .npy files
+        pcm_cache_dir: str = "data/pcm_cache",
+        pcm_cache_gb: float = 0,  # Keep decoded audio for re-transcription; 0 = off
     ):
         self.channel_url = channel_url
         self.model_size = model_size
         self.download_workers = download_workers
+        self.max_download_workers = max_download_workers
+        self.download_retry_attempts = download_retry_attempts
+        self.download_retry_schedule_hours = download_retry_schedule_hours
+        self.audio_format = audio_format
+        self.allow_video_fallback = allow_video_fallback
+        self.decode_workers = decode_workers
+        self.decode_dtype = decode_dtype
+        self.decode_to_disk = decode_to_disk
+        self.pcm_cache_dir = pcm_cache_dir
+        self.pcm_cache_gb = pcm_cache_gb
+        self.pcm_cache = None
         self.transcribe_workers = transcribe_workers
+        self.batch_size = batch_size
+        self.pipeline_mode = pipeline_mode
+        self.disk_budget_gb = disk_budget_gb
+        self.min_free_disk_gb = min_free_disk_gb
+        self.device = device
+        self.models_per_gpu = models_per_gpu
+        self.scheduling_policy = scheduling_policy
+        self.realtime_factor = realtime_factor
+        self.incremental_scrape = incremental_scrape
+        self.scrape_stop_after_known = scrape_stop_after_known
+        self.full_resync_days = full_resync_days
+        self.full_resync = full_resync
+        self.streaming_scrape = streaming_scrape
+        self.metadata_workers = metadata_workers
+        self.metadata_retry_days = metadata_retry_days
         self.channel_name = None
 
         # Initialize components
-        self.tracker = ProgressTracker(db_path=db_path)
-        self.scraper = ChannelScraper(channel_url)
+        self.tracker = ProgressTracker(
+            db_path=db_path,
+            synchronous=db_synchronous,
+            commit_interval=db_commit_interval,
+            min_duration=min_duration_minutes * 60,
+            max_duration=max_duration_minutes * 60
+        )
+        scrape_cache = None
+        if scrape_cache_ttl_hours > 0:
+            scrape_cache = ScrapeCache(scrape_cache_dir, ttl_seconds=scrape_cache_ttl_hours * 3600,
+                                       refresh_stop_after=scrape_stop_after_known)
+        self.scraper = ChannelScraper(channel_url, tabs=scrape_tabs, cache=scrape_cache)
 
         # Scraper will set channel_name, but we need to get it first for folder creation
         # We'll initialize downloader and transcriber after getting channel name
@@ -563,16 +2987,430 @@ class ChannelTranscriptionOrchestrator:
         self.transcript_base_dir = transcript_base_dir
         self.downloader = None
         self.transcriber = None
+        self.pool = None  # TranscriptionPool when transcribe_workers > 1
+        self.decoder = None  # AudioDecoder when decode_workers > 0
+        self.slots = None  # DeviceSlots planned by _plan_transcription
+
+    def _plan_transcription(self):
+        """Plan the transcription slots and set up the decode stage; no model is loaded yet"""
+        self.slots = [DeviceSlot(self.device)]
+        if self.transcribe_workers != 1:
+            self.slots = plan_device_slots(
+                self.transcribe_workers,
+                self.device,
+                model_size=self.model_size,
+                models_per_gpu=self.models_per_gpu
+            )
+
+        if self.pcm_cache_gb > 0:
+            self.pcm_cache = PCMCache(self.pcm_cache_dir, max_bytes=int(self.pcm_cache_gb * 1e9))
+
+        # The PCM cache is filled by the decode stage, so it needs at least one decoder
+        decode_workers = self.decode_workers or (1 if self.pcm_cache else 0)
+        if decode_workers > 0:
+            # Worker processes can't receive large arrays cheaply; hand them .npy files
+            self.decoder = AudioDecoder(
+                max_workers=decode_workers,
+                dtype=self.decode_dtype,
+                to_disk=self.decode_to_disk or self._uses_pool,
+                cache=self.pcm_cache
+            )
+
+    @property
+    def _uses_pool(self) -> bool:
+        return len(self.slots) > 1
+
+    def _start_transcription(self):
+        """Load the in-process transcriber, or spawn a worker pool when several slots are planned (once)"""
+        if self.pool or self.transcriber:
+            return
+        if self._uses_pool:
+            self.pool = TranscriptionPool(
+                model_size=self.model_size,
+                output_dir=self.transcript_base_dir,
+                db_path=self.tracker.db_path,
+                slots=self.slots,
+                channel_name=self.channel_name,
+                on_result=lambda video_id, path: self.downloader.disk_budget.notify()
+            ).start()
+        else:
+            slot = self.slots[0]
+            self.transcriber = GPUTranscriber(
+                model_size=self.model_size,
+                output_dir=self.transcript_base_dir,
+                channel_name=self.channel_name,
+                device=slot.device,
+                device_index=slot.device_index,
+                cpu_threads=slot.cpu_threads
+            )
+
+    def _scrape(self) -> Iterator[VideoInfo]:
+        """
+        Yield videos from the channel, incrementally when a full scrape has been done before
+        A full scrape runs on the first sync, when forced, or when the last
+        full scrape is older than full_resync_days. The high-water mark only
+        moves once the scrape has been consumed to the end, and the scrape
+        only counts as full when the scraper paged the whole channel live
+        (not a cached listing or a partial refresh of one).
+        """
+        forced = self.full_resync
+        state = self.tracker.get_scrape_state(self.channel_url)
+        if state and self.full_resync_days > 0:
+            if not state['last_full_scrape_at']:
+                # Earlier syncs were served from the scrape cache
+                logger.info("No full scrape recorded yet - doing a full resync")
+                forced = True
+            else:
+                age_days = (time.time() - state['last_full_scrape_at']) / 86400
+                if age_days >= self.full_resync_days:
+                    logger.info(f"Last full scrape was {age_days:.1f} days ago - doing a full resync")
+                    forced = True
+        incremental = (self.incremental_scrape and not forced
+                       and bool(state and state['last_full_scrape_at']))
+
+        if incremental:
+            logger.info(f"Incremental scrape (stops after {self.scrape_stop_after_known} known videos)")
+            videos = self.scraper.iter_videos(
+                known_ids=self.tracker.known_video_ids(),
+                stop_after_known=self.scrape_stop_after_known
+            )
+        else:
+            # A forced resync bypasses the scrape cache (and refreshes it)
+            videos = self.scraper.iter_videos(use_cache=not forced)
+
+        yield from videos
+
+        if self.scraper.newest_video_id:
+            self.tracker.record_scrape(self.channel_url, self.scraper.newest_video_id,
+                                       full=self.scraper.complete_listing)
+
+    def _stream_scraped(self, scraped: Iterator[VideoInfo]) -> Iterator[dict]:
+        """
+        Yield videos for download while the channel is still being scraped
+        A background thread inserts videos in small batches as playlist pages
+        arrive and hands new ones straight to the download pipeline (in discovery order, newest
+        first). Once the scrape ends, the rest of the pending videos follow in
+        scheduling-policy order.
+        """
+        found = queue.Queue()
+        done = object()
+        stop = threading.Event()
+
+        buffer = []
+        new_count = 0
+        last_flush = 0.0  # The first video is inserted (and queued) right away
+
+        def flush():
+            nonlocal new_count, last_flush
+            for video in self.tracker.add_new_videos(buffer):
+                new_count += 1
+                if self.tracker.in_duration_range(video.duration):
+                    found.put(video)
+            buffer.clear()
+            last_flush = time.time()
+
+        def feed():
+            try:
+                for video in scraped:
+                    if stop.is_set():
+                        return
+                    # One transaction per batch of videos, but don't hold a
+                    # found video back for long while the next page loads
+                    buffer.append(video)
+                    if len(buffer) >= SCRAPE_INSERT_BATCH or time.time() - last_flush >= SCRAPE_INSERT_SECONDS:
+                        flush()
+                flush()
+                logger.info(f"Scrape finished - new videos since last run: {new_count}")
+            except Exception as e:
+                logger.error(f"Scrape stopped early, continuing with the videos found so far: {e}")
+                if buffer and not stop.is_set():
+                    flush()
+            finally:
+                found.put(done)
+
+        threading.Thread(target=feed, name="scrape-feed", daemon=True).start()
+
+        seen = set()
+        try:
+            while True:
+                video = found.get()
+                if video is done:
+                    break
+                seen.add(video.video_id)
+                yield {
+                    'video_id': video.video_id,
+                    'url': video.url,
+                    'title': video.title,
+                    'duration': video.duration or 0,
+                    'channel': video.channel,
+                    'source_tab': video.source_tab
+                }
+
+            # Videos already queued above may still be waiting as 'downloaded'
+            for video in self.tracker.iter_pending_videos(policy=self.scheduling_policy):
+                if video['video_id'] not in seen:
+                    yield video
+        finally:
+            stop.set()
+
+    def _start_decodes(self, upcoming: deque):
+        """Start decoding the files at the head of a transcription queue (within the decoder's lookahead)"""
+        if not self.decoder:
+            return
+        for i in range(min(len(upcoming), self.decoder.lookahead)):
+            video_id, audio_path, duration, decoding, *pcm = upcoming[i]
+            if audio_path is not None and decoding is None:
+                upcoming[i] = (video_id, audio_path, duration, self.decoder.submit(video_id, audio_path), *pcm)
+
+    def _cached_pcm(self, video: dict):
+        """Decoded audio for a video from the PCM cache (array, or .npy path for the pool), or None"""
+        if not self.pcm_cache or video['video_id'] not in self.pcm_cache:
+            return None
+        if self._uses_pool:
+            dest = self.downloader.output_dir / f"{video['video_id']}.pcm.npy"
+            return self.pcm_cache.link(video['video_id'], str(dest))
+        return self.pcm_cache.load(video['video_id'])
+
+    def _transcribe(self, video_id: str, audio_path: Optional[str], duration: float = 0, decoding=None,
+                    pcm=None):
+        """Hand a downloaded file to whichever transcription engine is running (audio_path is None for cached PCM)"""
+        if decoding is not None:
+            pcm = self.decoder.collect(video_id, audio_path, decoding, self.tracker)
+            if pcm is None:
+                # Bad file: failed in the decode stage, never reaches a model
+                self.downloader.disk_budget.notify()
+                return
+
+        if self.pool:
+            self.pool.submit(video_id, audio_path, duration, pcm_path=pcm)
+        else:
+            self.transcriber.transcribe_single(video_id, audio_path, self.tracker, pcm=pcm)
+            # Audio was deleted - let downloads waiting on the disk budget continue
+            self.downloader.disk_budget.notify()
+
+    def _process_batched(self, pending_videos: Iterator[dict], pending_count: int):
+        """Download a batch, wait for it, then transcribe it (legacy mode)"""
+        batch_size = self.batch_size
+        total_batches = (pending_count - 1) // batch_size + 1
+        batch_num = 0
+
+        while True:
+            batch = list(itertools.islice(pending_videos, batch_size))
+            if not batch:
+                break
+            batch_num += 1
+            logger.info(f"\nProcessing batch {batch_num}/~{total_batches}")
+
+            # Videos in the PCM cache skip download and decode
+            cached = []
+            for video in batch:
+                pcm = self._cached_pcm(video)
+                if pcm is not None:
+                    cached.append((video, pcm))
+            if cached:
+                logger.info(f"{len(cached)} videos found in the PCM cache")
+                cached_ids = {video['video_id'] for video, _ in cached}
+                batch = [video for video in batch if video['video_id'] not in cached_ids]
+
+            # Download batch
+            logger.info("Downloading batch...")
+            self.downloader.download_batch(batch, self.tracker)
+
+            # Get downloaded videos for this batch
+            downloaded = []
+            for v in batch:
+                cursor = self.tracker.conn.cursor()
+                cursor.execute('SELECT status FROM videos WHERE video_id = ?', (v['video_id'],))
+                result = cursor.fetchone()
+                if result and result[0] == 'downloaded':
+                    downloaded.append(v)
+
+            # Transcribe batch (with a decoder, the next few files decode
+            # while the transcriber works through the batch in order)
+            logger.info("Transcribing batch...")
+            to_transcribe = []
+            for video in downloaded:
+                cursor = self.tracker.conn.cursor()
+                cursor.execute('SELECT audio_path FROM videos WHERE video_id = ?', (video['video_id'],))
+                result = cursor.fetchone()
+                if result and result[0]:
+                    to_transcribe.append((video['video_id'], result[0], video.get('duration') or 0, None))
+            for video, pcm in cached:
+                self._transcribe(video['video_id'], None, video.get('duration') or 0, pcm=pcm)
+            upcoming = deque(to_transcribe)
+            while upcoming:
+                self._start_decodes(upcoming)
+                self._transcribe(*upcoming.popleft())
+            if self.pool:
+                self.pool.wait()
+
+    def _process_streaming(self, pending_videos: Iterator[dict], pending_count: Optional[int]):
+        """
+        Overlap downloads and transcription
+        Download workers push finished files onto a bounded queue and the
+        transcriber picks each one up as soon as it lands. The queue bound
+        (batch_size, plus the decoder's few lookahead files) caps how many
+        downloaded-but-untranscribed files exist.
+        """
+        ready = queue.Queue(maxsize=max(1, self.batch_size))
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            # Block while the queue is full, but give up once we're stopping
+            while not stop.is_set():
+                try:
+                    ready.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def download(video: dict):
+            if stop.is_set():
+                return
+            pcm = self._cached_pcm(video)
+            if pcm is not None:
+                logger.info(f"Using cached audio for {video['video_id']}")
+                put((video['video_id'], None, video.get('duration') or 0, None, pcm))
+                return
+            audio_path = self.downloader.download_single(video, self.tracker)
+            if audio_path:
+                put((video['video_id'], audio_path, video.get('duration') or 0, None))
+
+        def produce():
+            # Pull videos from the tracker lazily; the semaphore keeps only a
+            # couple of videos per worker queued in the executor at a time
+            threads = self.downloader.thread_count
+            in_flight = threading.Semaphore(threads * 2)
+
+            def download_and_release(video: dict):
+                try:
+                    download(video)
+                finally:
+                    in_flight.release()
+
+            try:
+                with ThreadPoolExecutor(max_workers=threads) as executor:
+                    futures = set()
+                    for video in pending_videos:
+                        while not in_flight.acquire(timeout=0.5):
+                            if stop.is_set():
+                                break
+                        if stop.is_set():
+                            break
+                        futures.add(executor.submit(download_and_release, video))
+
+                        finished = {f for f in futures if f.done()}
+                        for future in finished:
+                            self._log_download_failure(future)
+                        futures -= finished
+
+                    for future in as_completed(futures):
+                        self._log_download_failure(future)
+            finally:
+                put(done)
+
+        what = f"{pending_count} videos" if pending_count is not None else "videos as they are scraped"
+        workers = f"{self.downloader.current_concurrency} download workers"
+        if self.downloader.concurrency:
+            workers += f", adaptive up to {self.downloader.thread_count}"
+        logger.info(f"Streaming {what} ({workers}, queue size {ready.maxsize})")
+
+        producer = threading.Thread(target=produce, name="download-producer", daemon=True)
+        producer.start()
+
+        # Files taken off the queue; only these are decoded ahead, which
+        # bounds how much decoded audio is held at once
+        upcoming = deque()
+        lookahead = self.decoder.lookahead if self.decoder else 1
+        finished = False
+        handed_off = 0
+        try:
+            while True:
+                while not finished and len(upcoming) < lookahead:
+                    try:
+                        item = ready.get(block=not upcoming)
+                    except queue.Empty:
+                        break
+                    if item is done:
+                        finished = True
+                    else:
+                        upcoming.append(item)
+                if not upcoming:
+                    break
+                self._start_decodes(upcoming)
+                # No-op unless loading was deferred until there was work
+                self._start_transcription()
+                self._transcribe(*upcoming.popleft())
+                handed_off += 1
+                logger.info(f"Progress: {handed_off} sent to transcription, "
+                            f"{ready.qsize() + len(upcoming)} waiting in queue")
+            if self.pool:
+                self.pool.wait()
+        finally:
+            # Unblock producers (e.g. on Ctrl+C) so worker threads can exit
+            stop.set()
+            producer.join(timeout=5)
+
+    @staticmethod
+    def _log_stage_metrics(metrics: dict):
+        """Log per-stage timings recorded during this run"""
+        if not metrics:
+            return
+        logger.info("[TIMING] STAGE TIMINGS (this run)")
+        for stage in ('download', 'decode', 'transcribe'):
+            m = metrics.get(stage)
+            if not m:
+                continue
+            line = (f"  {stage:<11} {m['attempts']:>6,} attempts  {m['failures']:>4,} failed  "
+                    f"{m['seconds'] / 3600:>6.2f} h  avg {m['avg_seconds']:.1f}s")
+            if stage == 'download':
+                line += f"  {m['bytes'] / 1e9:.2f} GB  {m['mb_per_second']:.1f} MB/s"
+                if m['avg_concurrency']:
+                    line += f"  avg concurrency {m['avg_concurrency']:.1f}"
+            else:
+                line += f"  {m['realtime_factor']:.0f}x realtime"
+            logger.info(line)
+        logger.info("")
+
+    @staticmethod
+    def _log_download_failure(future):
+        """Report unexpected exceptions from a download worker"""
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"Download worker failed: {e}")
 
     def run(self):
         """Execute the complete transcription pipeline"""
+        try:
+            self._run()
+        finally:
+            # Unfinished rows go straight back to the queue, and
+            # group-committed updates are written, even on errors and Ctrl+C
+            self.tracker.release_leases()
+            self.tracker.close()
+
+    def _run(self):
         logger.info("=" * 80)
         logger.info("YouTube Channel Bulk Transcriber - GPU Accelerated")
         logger.info("=" * 80)
 
+        # Stage metrics are summarised for this run only (created_at is UTC)
+        run_started = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+
         # Step 1: Scrape channel
         logger.info("\n[STEP 1/3] Scraping channel for videos...")
-        videos = self.scraper.scrape()
+        stream_scrape = self.streaming_scrape and self.pipeline_mode != "batch"
+        scraped = self._scrape()
+        if stream_scrape:
+            # Only wait for the first video (it names the channel folders);
+            # the rest are inserted and queued while downloads run
+            first = next(scraped, None)
+            videos = [first] if first else []
+        else:
+            videos = list(scraped)
 
         if not videos:
             logger.error("No videos found. Exiting.")
@@ -583,20 +3421,49 @@ class ChannelTranscriptionOrchestrator:
         logger.info(f"Channel: {self.channel_name}")
 
         # Now initialize downloader and transcriber with channel name
+        # The disk budget only makes sense when transcription frees space
+        # while downloads are running, so batch mode ignores it
+        budget_enabled = self.pipeline_mode != "batch"
         self.downloader = AudioDownloader(
             output_dir=self.audio_base_dir,
             channel_name=self.channel_name,
-            max_workers=self.download_workers
+            max_workers=self.download_workers,
+            disk_budget_bytes=int(self.disk_budget_gb * 1e9) if budget_enabled else 0,
+            min_free_bytes=int(self.min_free_disk_gb * 1e9) if budget_enabled else 0,
+            max_concurrency=self.max_download_workers,
+            retry_attempts=self.download_retry_attempts,
+            retry_schedule_seconds=[hours * 3600 for hours in self.download_retry_schedule_hours],
+            audio_format=self.audio_format,
+            allow_video_fallback=self.allow_video_fallback,
+            min_duration=self.tracker.min_duration,
+            max_duration=self.tracker.max_duration
         )
-        self.transcriber = GPUTranscriber(
-            model_size=self.model_size,
-            output_dir=self.transcript_base_dir,
-            channel_name=self.channel_name
-        )
-
         # Add videos to database
-        for video in videos:
-            self.tracker.add_video(video)
+        if not stream_scrape:
+            new_count = self.tracker.add_videos(videos)
+            logger.info(f"New videos since last run: {new_count}")
+
+        # Recover videos left mid-download/transcription by a crashed run
+        self.tracker.reclaim_expired_leases(include_unleased=True)
+        # Earlier runs' transient download failures whose retry is due
+        self.tracker.requeue_due_retries()
+
+        # Flat listings often lack durations; look them up so scheduling,
+        # stats and the duration filter work from real numbers
+        if self.metadata_workers > 0:
+            found, failed = MetadataBackfill(
+                self.tracker,
+                max_workers=self.metadata_workers,
+                retry_after_seconds=self.metadata_retry_days * 86400
+            ).run()
+            if found or failed:
+                logger.info(f"Backfilled {found} durations ({failed} could not be looked up)")
+
+        # New videos were filtered on insert; re-check older rows in case the
+        # duration range changed since they were scraped (or was just learned)
+        skipped, restored = self.tracker.apply_duration_filter()
+        if skipped or restored:
+            logger.info(f"Duration filter: {skipped} videos newly skipped, {restored} restored")
 
         # Step 2: Check what needs to be processed
         logger.info("\n[STEP 2/3] Checking processing status...")
@@ -605,48 +3472,57 @@ class ChannelTranscriptionOrchestrator:
         logger.info(f"Completed: {stats['completed']}")
         logger.info(f"Pending: {stats['pending']}")
         logger.info(f"Errors: {stats['errors']}")
+        if stats['skipped']:
+            logger.info(f"Skipped (duration filter): {stats['skipped']}")
         logger.info(f"Total duration: {stats['total_hours']:.1f} hours")
         logger.info(f"Completed duration: {stats['completed_hours']:.1f} hours")
 
-        if stats['pending'] == 0:
+        status_counts = self.tracker.get_status_counts()
+        pending_count = sum(status_counts.get(status, {}).get('count', 0) for status in PENDING_STATUSES)
+
+        if stream_scrape:
+            logger.info(f"\n{pending_count} videos pending from earlier runs; new videos are "
+                        f"queued as the scrape finds them (then order: {self.scheduling_policy})")
+        elif pending_count == 0:
             logger.info("All videos already processed!")
             return
-
-        # Get pending videos
-        pending_videos = self.tracker.get_pending_videos()
-        logger.info(f"\n{len(pending_videos)} videos to process")
+        else:
+            logger.info(f"\n{pending_count} videos to process (order: {self.scheduling_policy})")
 
         # Step 3: Download audio files
         logger.info("\n[STEP 3/3] Downloading and transcribing...")
+        self._plan_transcription()
+        if not stream_scrape:
+            self._start_transcription()
+        # With a streaming scrape nothing may turn out to be pending, so the
+        # model is only loaded when the first downloaded file is queued
+
+        engines = len(self.slots)
+        makespan = simulate_makespan(
+            (v['duration'] for v in self.tracker.iter_pending_videos(policy=self.scheduling_policy)),
+            engines,
+            self.realtime_factor
+        )
+        logger.info(f"Estimated transcription time: {makespan / 3600:.1f} hours "
+                    f"({engines} worker(s) at {self.realtime_factor:.0f}x realtime)")
 
-        # Process in batches to manage disk space
-        batch_size = 20  # Download 20 at a time, then transcribe
-
-        for i in range(0, len(pending_videos), batch_size):
-            batch = pending_videos[i:i+batch_size]
-            logger.info(f"\nProcessing batch {i//batch_size + 1}/{(len(pending_videos)-1)//batch_size + 1}")
-
-            # Download batch
-            logger.info("Downloading batch...")
-            self.downloader.download_batch(batch, self.tracker)
-
-            # Get downloaded videos for this batch
-            downloaded = []
-            for v in batch:
-                cursor = self.tracker.conn.cursor()
-                cursor.execute('SELECT status FROM videos WHERE video_id = ?', (v['video_id'],))
-                result = cursor.fetchone()
-                if result and result[0] == 'downloaded':
-                    downloaded.append(v)
+        # Stream pending videos from the database page by page
+        if stream_scrape:
+            pending_videos = self._stream_scraped(itertools.chain(videos, scraped))
+        else:
+            pending_videos = self.tracker.iter_pending_videos(policy=self.scheduling_policy)
 
-            # Transcribe batch
-            logger.info("Transcribing batch...")
-            for video in downloaded:
-                cursor = self.tracker.conn.cursor()
-                cursor.execute('SELECT audio_path FROM videos WHERE video_id = ?', (video['video_id'],))
-                result = cursor.fetchone()
-                if result and result[0]:
-                    self.transcriber.transcribe_single(video['video_id'], result[0], self.tracker)
+        try:
+            if self.pipeline_mode == "batch":
+                self._process_batched(pending_videos, pending_count)
+            else:
+                self._process_streaming(pending_videos, None if stream_scrape else pending_count)
+        finally:
+            if self.pool:
+                self.pool.close()
+            if self.decoder:
+                self.decoder.close()
+            self.downloader.close()
 
         # Final statistics
         logger.info("\n" + "=" * 80)
@@ -682,6 +3558,8 @@ class ChannelTranscriptionOrchestrator:
         logger.info(f"Total Videos:          {final_stats['total']:,}")
         logger.info(f"Successfully Processed: {final_stats['completed']:,} ({final_stats['completed']/final_stats['total']*100:.1f}%)")
         logger.info(f"Failed/Errors:         {final_stats['errors']:,}")
+        if final_stats['skipped']:
+            logger.info(f"Skipped (duration):    {final_stats['skipped']:,}")
         logger.info(f"Pending:               {final_stats['pending']:,}")
         logger.info("")
         logger.info(f"Total Audio Duration:  {final_stats['completed_hours']:.1f} hours")
@@ -689,12 +3567,16 @@ class ChannelTranscriptionOrchestrator:
         if transcript_count > 0:
             logger.info(f"Average Words/Video:   {total_words//transcript_count:,} words")
         logger.info(f"Total Transcript Size: {total_file_size/1024/1024:.1f} MB")
+        saved_videos, saved_bytes = self.tracker.get_bytes_saved()
+        if saved_bytes:
+            logger.info(f"Audio Format Savings:  {saved_bytes / 1e9:.2f} GB over {saved_videos:,} downloads")
         logger.info("")
-        logger.info(f"Transcripts Location:  {self.transcriber.output_dir.absolute()}")
+        self._log_stage_metrics(self.tracker.get_stage_metrics(since=run_started))
+        engine = self.pool or self.transcriber
+        if engine:
+            logger.info(f"Transcripts Location:  {engine.output_dir.absolute()}")
         logger.info("=" * 80)
 
-        self.tracker.close()
-
 
 def main():
     """Main entry point"""
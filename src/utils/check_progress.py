@@ -30,23 +30,39 @@ def check_progress(db_path="../../data/transcription_progress.db"):
     print("=" * 80)
     print()
 
+    # Databases written by newer versions keep per-channel/status counters in
+    # channel_stats (maintained by triggers); read those instead of scanning
+    # every video. Older databases fall back to aggregating the videos table.
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'channel_stats'")
+    if cursor.fetchone():
+        stats_source = '''
+            (SELECT channel, status, video_count AS n, total_duration AS dur FROM channel_stats)
+        '''
+    else:
+        stats_source = '''
+            (SELECT channel, status, COUNT(*) AS n, SUM(duration) AS dur FROM videos GROUP BY channel, status)
+        '''
+
     # Overall statistics
-    cursor.execute('''
+    cursor.execute(f'''
         SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-            SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) as errors,
-            SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-            SUM(CASE WHEN status = 'downloading' THEN 1 ELSE 0 END) as downloading,
-            SUM(CASE WHEN status = 'downloaded' THEN 1 ELSE 0 END) as downloaded,
-            SUM(CASE WHEN status = 'transcribing' THEN 1 ELSE 0 END) as transcribing,
-            SUM(duration) as total_duration,
-            SUM(CASE WHEN status = 'completed' THEN duration ELSE 0 END) as completed_duration
-        FROM videos
+            SUM(n) as total,
+            SUM(CASE WHEN status = 'completed' THEN n ELSE 0 END) as completed,
+            SUM(CASE WHEN status = 'error' THEN n ELSE 0 END) as errors,
+            SUM(CASE WHEN status = 'pending' THEN n ELSE 0 END) as pending,
+            SUM(CASE WHEN status = 'downloading' THEN n ELSE 0 END) as downloading,
+            SUM(CASE WHEN status = 'downloaded' THEN n ELSE 0 END) as downloaded,
+            SUM(CASE WHEN status = 'transcribing' THEN n ELSE 0 END) as transcribing,
+            SUM(CASE WHEN status = 'skipped' THEN n ELSE 0 END) as skipped,
+            SUM(dur) as total_duration,
+            SUM(CASE WHEN status = 'completed' THEN dur ELSE 0 END) as completed_duration
+        FROM {stats_source}
     ''')
 
     stats = cursor.fetchone()
-    total, completed, errors, pending, downloading, downloaded, transcribing, total_dur, comp_dur = stats
+    total, completed, errors, pending, downloading, downloaded, transcribing, skipped, total_dur, comp_dur = (
+        value or 0 for value in stats
+    )
 
     if total == 0:
         print("No videos found in database.")
@@ -65,6 +81,8 @@ def check_progress(db_path="../../data/transcription_progress.db"):
     print(f"Downloaded:            {downloaded}")
     print(f"Transcribing:          {transcribing}")
     print(f"Errors:                {errors}")
+    if skipped:
+        print(f"Skipped (duration):    {skipped}")
     print()
     print(f"Total Duration:        {format_duration(total_dur or 0)}")
     print(f"Completed Duration:    {format_duration(comp_dur or 0)}")
@@ -80,11 +98,12 @@ def check_progress(db_path="../../data/transcription_progress.db"):
     # Status breakdown
     print(f"[STATUS] STATUS BREAKDOWN")
     print("-" * 80)
-    cursor.execute('''
-        SELECT status, COUNT(*), SUM(duration)
-        FROM videos
+    cursor.execute(f'''
+        SELECT status, SUM(n), SUM(dur)
+        FROM {stats_source}
         GROUP BY status
-        ORDER BY COUNT(*) DESC
+        HAVING SUM(n) > 0
+        ORDER BY SUM(n) DESC
     ''')
 
     for row in cursor.fetchall():
@@ -116,10 +135,7 @@ def check_progress(db_path="../../data/transcription_progress.db"):
     print()
 
     # Errors (if any)
-    cursor.execute('''
-        SELECT COUNT(*) FROM videos WHERE status = 'error'
-    ''')
-    error_count = cursor.fetchone()[0]
+    error_count = errors
 
     if error_count > 0:
         print(f"[ERROR] ERRORS ({error_count} videos)")
@@ -141,20 +157,19 @@ def check_progress(db_path="../../data/transcription_progress.db"):
         print()
 
     # Channel info
-    cursor.execute('SELECT DISTINCT channel FROM videos')
+    cursor.execute(f'''
+        SELECT channel, SUM(n), SUM(CASE WHEN status = 'completed' THEN n ELSE 0 END)
+        FROM {stats_source}
+        GROUP BY channel
+        HAVING SUM(n) > 0
+    ''')
     channels = cursor.fetchall()
     if channels:
         print(f"[CHANNELS] CHANNELS")
         print("-" * 80)
-        for channel in channels:
-            channel_name = channel[0]
-            cursor.execute('''
-                SELECT COUNT(*), SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END)
-                FROM videos WHERE channel = ?
-            ''', (channel_name,))
-            ch_total, ch_completed = cursor.fetchone()
+        for channel_name, ch_total, ch_completed in channels:
             ch_progress = (ch_completed / ch_total * 100) if ch_total > 0 else 0
-            print(f"  {channel_name}: {ch_completed}/{ch_total} ({ch_progress:.1f}%)")
+            print(f"  {channel_name or None}: {ch_completed}/{ch_total} ({ch_progress:.1f}%)")
         print()
 
     # ETA estimation
@@ -174,6 +189,47 @@ def check_progress(db_path="../../data/transcription_progress.db"):
             print(f"  Estimated completion:   {remaining_time:.0f} minutes ({remaining_time/60:.1f} hours)")
             print()
 
+    # Per-stage timings (databases written by newer versions only)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'video_metrics'")
+    if cursor.fetchone():
+        cursor.execute('''
+            SELECT stage,
+                   COUNT(*),
+                   SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END),
+                   SUM(seconds),
+                   SUM(bytes),
+                   SUM(CASE WHEN success = 1 THEN audio_seconds ELSE 0 END),
+                   SUM(CASE WHEN success = 1 THEN seconds ELSE 0 END)
+            FROM video_metrics
+            GROUP BY stage
+        ''')
+        stage_rows = cursor.fetchall()
+        if stage_rows:
+            print(f"[TIMING] STAGE TIMINGS")
+            print("-" * 80)
+            for stage, attempts, failures, seconds, total_bytes, audio_seconds, ok_seconds in stage_rows:
+                seconds = seconds or 0
+                line = (f"  {stage:11s}: {attempts:5d} attempts  {failures or 0:4d} failed  "
+                        f"{format_duration(seconds)}  avg {seconds / attempts:.1f}s")
+                if total_bytes and seconds:
+                    line += f"  {total_bytes / 1e9:.2f} GB  {total_bytes / 1e6 / seconds:.1f} MB/s"
+                elif ok_seconds and audio_seconds:
+                    line += f"  {audio_seconds / ok_seconds:.0f}x realtime"
+                print(line)
+            print()
+
+    # Savings from downloading small audio-only streams (newer databases only)
+    cursor.execute("SELECT 1 FROM pragma_table_info('videos') WHERE name = 'bytes_saved'")
+    if cursor.fetchone():
+        cursor.execute('SELECT COUNT(*), SUM(bytes_saved) FROM videos WHERE bytes_saved IS NOT NULL')
+        saved_videos, saved_bytes = cursor.fetchone()
+        if saved_bytes:
+            print(f"[FORMAT] AUDIO FORMAT SAVINGS")
+            print("-" * 80)
+            print(f"  {saved_bytes / 1e9:.2f} GB less downloaded than the best audio streams "
+                  f"({saved_bytes / saved_videos / 1e6:.1f} MB per video, {saved_videos} videos)")
+            print()
+
     # Word count statistics
     print(f"[WORDS] TRANSCRIPTION STATISTICS")
     print("-" * 80)
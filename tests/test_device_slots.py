@@ -0,0 +1,87 @@
+"""Device planning and least-load scheduling for the transcription pool"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from channel_transcriber import DeviceScheduler, DeviceSlot, plan_device_slots, safe_filename
+
+
+def keys(slots):
+    return [slot.key for slot in slots]
+
+
+def test_gpu_slots_are_interleaved_across_devices():
+    slots = plan_device_slots(4, model_size="base", models_per_gpu=2, gpu_memory_gb=[24, 24])
+    assert keys(slots) == ["cuda:0", "cuda:1", "cuda:0", "cuda:1"]
+    # Any prefix of the plan spreads work over both GPUs
+    assert keys(plan_device_slots(2, models_per_gpu=2, gpu_memory_gb=[24, 24])) == ["cuda:0", "cuda:1"]
+
+
+def test_models_per_gpu_zero_fits_as_many_as_vram_allows():
+    # medium needs ~3.5 GB: 90% of 16 GB holds 4, 90% of 8 GB holds 2
+    slots = plan_device_slots(0, model_size="medium", models_per_gpu=0, gpu_memory_gb=[16, 8])
+    assert keys(slots) == ["cuda:0", "cuda:1", "cuda:0", "cuda:1", "cuda:0", "cuda:0"]
+
+
+def test_small_gpu_still_gets_one_model():
+    slots = plan_device_slots(0, model_size="large-v3", models_per_gpu=0, gpu_memory_gb=[4])
+    assert keys(slots) == ["cuda:0"]
+
+
+def test_more_workers_than_slots_share_devices():
+    slots = plan_device_slots(3, models_per_gpu=1, gpu_memory_gb=[24, 24])
+    assert keys(slots) == ["cuda:0", "cuda:1", "cuda:0"]
+
+
+def test_cpu_workers_split_the_cores():
+    slots = plan_device_slots(3, device="cpu", cpu_count=12)
+    assert [(slot.device, slot.cpu_threads) for slot in slots] == [("cpu", 4)] * 3
+    # 0 workers picks a count from the cores
+    assert len(plan_device_slots(0, device="cpu", cpu_count=16)) == 4
+
+
+def test_scheduler_assigns_to_least_loaded_device():
+    scheduler = DeviceScheduler([DeviceSlot("cuda", 0), DeviceSlot("cuda", 1)])
+    assert scheduler.assign("a", 600) == "cuda:0"
+    assert scheduler.assign("b", 100) == "cuda:1"
+    assert scheduler.assign("c", 100) == "cuda:1"
+    assert scheduler.load == {"cuda:0": 600, "cuda:1": 200}
+
+    scheduler.complete("a")
+    assert scheduler.load["cuda:0"] == 0
+    assert scheduler.assign("d", 50) == "cuda:0"
+
+
+def test_scheduler_weighs_load_by_slots_per_device():
+    # Two models on cuda:0 take twice the audio before cuda:1 looks less busy
+    scheduler = DeviceScheduler([DeviceSlot("cuda", 0), DeviceSlot("cuda", 0), DeviceSlot("cuda", 1)])
+    assert scheduler.assign("a", 100) == "cuda:0"
+    assert scheduler.assign("b", 100) == "cuda:1"
+    assert scheduler.assign("c", 100) == "cuda:0"
+
+
+def test_unknown_duration_still_counts_as_load():
+    scheduler = DeviceScheduler([DeviceSlot("cuda", 0), DeviceSlot("cuda", 1)])
+    assert scheduler.assign("a", 0) == "cuda:0"
+    assert scheduler.assign("b", None) == "cuda:1"
+
+
+def test_remove_slot_after_worker_death():
+    scheduler = DeviceScheduler([DeviceSlot("cuda", 0), DeviceSlot("cuda", 0), DeviceSlot("cuda", 1)])
+    scheduler.assign("a", 100)
+    scheduler.remove_slot("cuda:0")
+    assert scheduler.capacity == {"cuda:0": 1, "cuda:1": 1}
+
+    scheduler.remove_slot("cuda:0")
+    assert "cuda:0" not in scheduler.load
+    # Completing a file from the dead device is harmless, and new files avoid it
+    scheduler.complete("a")
+    assert all(scheduler.assign(f"v{i}", 100) == "cuda:1" for i in range(3))
+
+
+def test_safe_filename():
+    assert safe_filename("Chan: The/Best?  ") == "Chan TheBest"
+    assert safe_filename("x" * 150) == "x" * 100
+    assert safe_filename("Some title", 4) == "Some"
@@ -0,0 +1,118 @@
+"""Work leases: claim_next across connections, expiry, and release on exit"""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from channel_transcriber import ProgressTracker, VideoInfo
+
+
+def make_videos(count):
+    return [VideoInfo(f"vid{i:08d}", f"https://www.youtube.com/watch?v=vid{i:08d}", f"Video {i}", 60 + i, "Chan")
+            for i in range(count)]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "leases.db")
+    tracker = ProgressTracker(db_path=path)
+    tracker.add_videos(make_videos(40))
+    tracker.close()
+    return path
+
+
+def status_of(db_path, video_id):
+    tracker = ProgressTracker(db_path=db_path)
+    try:
+        return tracker.conn.execute('SELECT status, claimed_by FROM videos WHERE video_id = ?',
+                                    (video_id,)).fetchone()
+    finally:
+        tracker.close()
+
+
+def test_two_claimers_never_get_the_same_row(db_path):
+    trackers = [ProgressTracker(db_path=db_path, worker_id=f"worker-{i}") for i in range(2)]
+    claimed = [[], []]
+    errors = []
+
+    def claim_all(index):
+        try:
+            while True:
+                video = trackers[index].claim_next('download')
+                if video is None:
+                    return
+                claimed[index].append(video['video_id'])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=claim_all, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for tracker in trackers:
+        tracker.close()
+
+    assert not errors
+    assert not set(claimed[0]) & set(claimed[1])
+    assert len(claimed[0]) + len(claimed[1]) == 40
+    for index, video_ids in enumerate(claimed):
+        for video_id in video_ids[:1]:
+            assert status_of(db_path, video_id) == ('downloading', f'worker-{index}')
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(db_path):
+    first = ProgressTracker(db_path=db_path, worker_id="worker-a")
+    second = ProgressTracker(db_path=db_path, worker_id="worker-b")
+    try:
+        video = first.claim_next('download', lease_seconds=-1)  # Expired at once
+        again = second.claim_next('download')
+        assert again['video_id'] == video['video_id']
+        assert not first.renew_lease(video['video_id'])
+        assert second.renew_lease(video['video_id'])
+    finally:
+        first.close()
+        second.close()
+
+
+def test_live_lease_is_not_reclaimed(db_path):
+    first = ProgressTracker(db_path=db_path, worker_id="worker-a")
+    second = ProgressTracker(db_path=db_path, worker_id="worker-b")
+    try:
+        video = first.claim_next('download')
+        assert second.reclaim_expired_leases(include_unleased=True) == 0
+        assert second.claim_next('download')['video_id'] != video['video_id']
+    finally:
+        first.close()
+        second.close()
+
+
+def test_release_leases_requeues_unfinished_rows(db_path):
+    tracker = ProgressTracker(db_path=db_path)
+    tracker.update_status("vid00000001", 'downloading')
+    tracker.update_status("vid00000002", 'transcribing', audio_path="x.webm")
+    assert tracker.release_leases() == 2
+    tracker.close()
+    assert status_of(db_path, "vid00000001") == ('pending', None)
+    assert status_of(db_path, "vid00000002") == ('downloaded', None)
+
+
+def test_lease_of_exited_process_is_reclaimed(db_path):
+    # A worker id naming this host and a pid that has already exited
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    crashed = ProgressTracker(db_path=db_path)
+    crashed.worker_id = crashed.worker_id.rsplit(':', 1)[0] + f":{process.pid}"
+    crashed.update_status("vid00000003", 'downloading')
+    crashed.close()
+
+    tracker = ProgressTracker(db_path=db_path)
+    assert tracker.reclaim_expired_leases() == 1
+    videos = [video['video_id'] for video in tracker.iter_pending_videos()]
+    tracker.close()
+    assert "vid00000003" in videos
@@ -0,0 +1,59 @@
+"""EXPLAIN QUERY PLAN checks for the hot database queries (see scripts/utils/check_query_plans.py)"""
+
+import importlib.util
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "utils" / "check_query_plans.py"
+spec = importlib.util.spec_from_file_location("check_query_plans", SCRIPT)
+check_query_plans = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(check_query_plans)  # also puts src/ on sys.path
+
+from channel_transcriber import ProgressTracker, SCHEMA_VERSION, POLICY_ORDER_BY
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    # A duration range makes the pending queries include the filter clause
+    tracker = ProgressTracker(db_path=str(tmp_path / "plans.db"), min_duration=60, max_duration=4 * 3600)
+    yield tracker
+    tracker.close()
+
+
+def test_database_is_fully_migrated(tracker):
+    version = tracker.conn.execute('PRAGMA user_version').fetchone()[0]
+    assert version == SCHEMA_VERSION
+
+
+def test_every_policy_has_keyset_queries(tracker):
+    names = [name for name, _, _, _ in check_query_plans.hot_queries(tracker)]
+    for policy in POLICY_ORDER_BY:
+        for keyset_policy in check_query_plans.keyset_policies(policy):
+            assert any("keyset" in name and f"({keyset_policy})" in name for name in names)
+
+
+def test_hot_queries_use_indexes(tracker):
+    for name, sql, params, ordered in check_query_plans.hot_queries(tracker):
+        plan = tracker.explain(sql, params)
+        assert not any(check_query_plans.is_full_scan(detail) for detail in plan), (name, plan)
+        if ordered:
+            assert not any("USE TEMP B-TREE" in detail for detail in plan), (name, plan)
+
+
+def test_upgraded_database_gets_priority_index(tmp_path):
+    db_path = str(tmp_path / "old.db")
+    ProgressTracker(db_path=db_path).close()
+    conn = sqlite3.connect(db_path)
+    conn.execute('DROP INDEX idx_videos_status_priority_duration_id')
+    conn.execute('PRAGMA user_version = 13')
+    conn.commit()
+    conn.close()
+
+    tracker = ProgressTracker(db_path=db_path)
+    sql, params = tracker._keyset_query('pending', None, 'priority', 500)
+    plan = tracker.explain(sql, params)
+    tracker.close()
+    assert any("idx_videos_status_priority_duration_id" in detail for detail in plan)
+    assert not any("USE TEMP B-TREE" in detail for detail in plan)